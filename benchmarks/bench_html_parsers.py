@@ -0,0 +1,63 @@
+"""
+Benchmark: HTML parser backends for the FotMob HTML parsers.
+
+Runs parse_fixtures_from_html() and parse_head_to_head() over saved HTML pages
+(rendered FotMob team / match pages) with each available backend, checks that
+every backend produces the same output, and reports the time per page.
+
+Usage: python benchmarks/bench_html_parsers.py page1.html [page2.html ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from persib_scraper import lxml, parse_fixtures_from_html, parse_head_to_head
+
+BACKENDS = ["html.parser"] + (["lxml"] if lxml is not None else [])
+PARSERS = {
+    "fixtures": parse_fixtures_from_html,
+    "head_to_head": parse_head_to_head,
+}
+
+
+def run(parser, html: str, backend: str, repeat: int = 3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parser(html, backend=backend)
+        best = min(best, time.perf_counter() - start)
+    if isinstance(result, dict):
+        result.pop("scraped_at", None)
+    return result, best
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]]
+    if not paths:
+        print(__doc__)
+        sys.exit(1)
+
+    totals = {backend: 0.0 for backend in BACKENDS}
+    for path in paths:
+        html = path.read_text(encoding="utf-8")
+        print(f"{path.name} ({len(html) / 1024:.0f} KB)")
+        for name, parser in PARSERS.items():
+            outputs = {}
+            for backend in BACKENDS:
+                outputs[backend], elapsed = run(parser, html, backend)
+                totals[backend] += elapsed
+                print(f"  {name:<13} {backend:<12} {elapsed * 1000:9.1f} ms")
+            if any(out != outputs[BACKENDS[0]] for out in outputs.values()):
+                print(f"  {name:<13} OUTPUT DIFFERS between backends")
+
+    print("Total")
+    for backend, total in totals.items():
+        print(f"  {backend:<12} {total * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: single-pass standings parser vs. the three-pass path.
+
+Builds a synthetic FotMob Team API payload with a large composite (group
+stage) table and times parse_standings_views_from_api() against three calls
+to parse_standings_from_api() plus extract_persib_standings().
+
+Usage: python benchmarks/bench_standings.py [groups] [teams_per_group]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from persib_scraper import (
+    STANDINGS_VIEWS,
+    TEAM_ID,
+    extract_persib_standings,
+    parse_standings_from_api,
+    parse_standings_views_from_api,
+)
+
+
+def make_rows(group: int, teams: int) -> list:
+    rows = []
+    for i in range(teams):
+        team_id = int(TEAM_ID) if group == 0 and i == 0 else group * 1000 + i
+        rows.append({
+            "idx": i + 1,
+            "id": team_id,
+            "name": "Persib Bandung" if team_id == int(TEAM_ID) else f"Team {team_id}",
+            "pageUrl": f"/teams/{team_id}/overview/team-{team_id}",
+            "played": 6, "wins": 3, "draws": 1, "losses": 2,
+            "scoresStr": f"{i}-{teams - i}",
+            "goalConDiff": 2 * i - teams,
+            "pts": 10,
+        })
+    return rows
+
+
+def make_payload(groups: int, teams: int) -> dict:
+    tables = []
+    for g in range(groups):
+        rows = make_rows(g, teams)
+        tables.append({
+            "leagueName": f"Group {g + 1}",
+            "table": {view: rows for view in STANDINGS_VIEWS},
+        })
+    return {"table": [{"data": {"leagueName": "Composite Cup", "leagueId": 1, "pageUrl": "/leagues/1", "tables": tables}}]}
+
+
+def three_pass(api_data: dict) -> dict:
+    result = {view: parse_standings_from_api(api_data, view) for view in STANDINGS_VIEWS}
+    result["persib"] = extract_persib_standings(result["all"])
+    return result
+
+
+def strip_timestamps(result: dict) -> dict:
+    return {k: {**v, "scraped_at": None} for k, v in result.items() if k != "index"}
+
+
+def main():
+    groups = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    teams = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    api_data = make_payload(groups, teams)
+
+    assert strip_timestamps(three_pass(api_data)) == strip_timestamps(parse_standings_views_from_api(api_data))
+
+    runs = 20
+    old = min(timeit.repeat(lambda: three_pass(api_data), number=runs, repeat=5)) / runs
+    new = min(timeit.repeat(lambda: parse_standings_views_from_api(api_data), number=runs, repeat=5)) / runs
+    print(f"{groups} groups x {teams} teams")
+    print(f"  three-pass:  {old * 1000:8.2f} ms")
+    print(f"  single-pass: {new * 1000:8.2f} ms  ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
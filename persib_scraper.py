@@ -3,15 +3,32 @@ Persib Bandung FotMob Scraper
 Fetches data using requests and Playwright, and parses them directly to JSON.
 """
 
+import hashlib
 import json
+import os
 import re
+import tempfile
+import threading
+import time
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from collections import defaultdict, deque
 from typing import Optional, List, Dict
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
+try:
+    import lxml  # noqa: F401  (optional fast HTML tree builder)
+except ImportError:
+    lxml = None
+
 # Configuration
 TEAM_ID = "165196"
 LEAGUE_ID = "8983"
@@ -64,19 +81,576 @@ SOFASCORE_HEADERS = {
     'Sec-Fetch-Site': 'same-site'
 }
 
-def save_to_json(data: dict, filename: str):
-    """Save data to JSON file."""
+# Max simultaneous requests per host (other hosts default to 4)
+HOST_CONCURRENCY = {
+    "www.fotmob.com": 2,
+    "data.fotmob.com": 5,
+    "api.sofascore.com": 6,
+    "www.sofascore.com": 2,
+}
+
+# Token bucket per host: (sustained requests per second, burst size).
+# Other hosts default to DEFAULT_HOST_RATE.
+HOST_RATES = {
+    "www.fotmob.com": (2.0, 4),
+    "data.fotmob.com": (8.0, 10),
+    "api.sofascore.com": (5.0, 6),
+    "www.sofascore.com": (1.0, 2),
+}
+DEFAULT_HOST_RATE = (4.0, 4)
+
+# A 429/403 halves the host's rate (never below this fraction of the base
+# rate); every successful response recovers a step of the base rate
+MIN_RATE_FACTOR = 0.1
+RATE_RECOVERY_STEP = 0.05
+
+# Extra attempts for a request answered with 429/403, after the slow-down
+THROTTLE_RETRIES = 2
+THROTTLE_STATUSES = (403, 429)
+
+class _HostState:
+    def __init__(self, host: str):
+        self.concurrency = HOST_CONCURRENCY.get(host, 4)
+        self.base_rate, self.burst = HOST_RATES.get(host, DEFAULT_HOST_RATE)
+        self.rate = self.base_rate
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self.waiting = deque()  # sequence numbers of queued requests, oldest first
+        self.requests = 0
+        self.throttled = 0
+
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RequestTicket:
+    """One granted request slot; report the response status before it is released."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.status = None
+        self.retry_after = None
+
+    def report(self, status: Optional[int], retry_after=None):
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def throttled(self) -> bool:
+        return self.status in THROTTLE_STATUSES
+
+
+class RequestScheduler:
+    """Central pacing for every outgoing request, per host.
+
+    Each host has a concurrency limit, a token bucket (HOST_RATES) and a FIFO
+    queue of waiting requests: the oldest waiter gets the next free slot once a
+    token is available. A 429/403 halves the host's rate and pauses it
+    (Retry-After when given); successful responses slowly restore the rate.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._hosts = {}
+        self._sequence = 0
+
+    def _state(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(host)
+        return self._hosts[host]
+
+    def acquire(self, url: str) -> RequestTicket:
+        host = urlparse(url).netloc
+        with self._cond:
+            state = self._state(host)
+            self._sequence += 1
+            entry = self._sequence
+            state.waiting.append(entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    state.refill(now)
+                    timeout = None
+                    if state.waiting[0] == entry and state.in_flight < state.concurrency:
+                        if now >= state.paused_until and state.tokens >= 1:
+                            break
+                        timeout = max(state.paused_until - now, (1 - state.tokens) / state.rate, 0.005)
+                    self._cond.wait(timeout)
+            except BaseException:
+                state.waiting.remove(entry)
+                self._cond.notify_all()
+                raise
+            state.waiting.popleft()
+            state.tokens -= 1
+            state.in_flight += 1
+            state.requests += 1
+            # The next waiter for this host may be able to go too
+            self._cond.notify_all()
+        return RequestTicket(host)
+
+    def release(self, ticket: RequestTicket):
+        with self._cond:
+            state = self._state(ticket.host)
+            state.in_flight -= 1
+            if ticket.throttled:
+                state.throttled += 1
+                state.rate = max(state.base_rate * MIN_RATE_FACTOR, state.rate / 2)
+                state.tokens = min(state.tokens, 0.0)
+                pause = _retry_after_seconds(ticket.retry_after) or 1.0 / state.rate
+                state.paused_until = max(state.paused_until, time.monotonic() + pause)
+                print(f"  {ticket.host} answered {ticket.status}: slowing to {state.rate:.2f} req/s, pausing {pause:.1f}s")
+            elif ticket.status is not None and ticket.status < 400:
+                state.rate = min(state.base_rate, state.rate + state.base_rate * RATE_RECOVERY_STEP)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold a paced slot for `url` for the duration of one request."""
+        ticket = self.acquire(url)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def summary(self) -> Dict[str, dict]:
+        with self._cond:
+            return {
+                host: {"requests": st.requests, "throttled": st.throttled, "rate": round(st.rate, 2)}
+                for host, st in self._hosts.items()
+            }
+
+
+def _retry_after_seconds(value) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None  # HTTP-date form: fall back to the default pause
+
+SCHEDULER = RequestScheduler()
+
+# Opt-in profiler for every stage: "cprofile" or "pyinstrument" (optional dependency).
+# Profiles are written to .cache/profiles/<stage>.prof / .html.
+PROFILE_STAGES = os.environ.get("SCRAPER_PROFILE", "").lower()
+
+RUN_REPORT_FILE = "run_report.json"
+
+class RunReport:
+    """Machine-readable instrumentation of one run (written to run_report.json).
+
+    Collects per-stage wall time, per-URL fetches (transport, status, latency,
+    bytes, cache hits, retries), aggregate timers for CPU-side work (HTML/JSON
+    parsing, file writes, browser launch/warmup) and counters. Thread-safe: the
+    phases record into it from their own threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.fetches = []
+        self.timers = defaultdict(lambda: {"count": 0, "seconds": 0.0})
+        self.counters = defaultdict(int)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] += n
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.timers[name]["count"] += 1
+                self.timers[name]["seconds"] += elapsed
+
+    def record_fetch(self, url: str, transport: str, status, seconds: float, size: int = 0,
+                     cache_hit: bool = False, retries: int = 0):
+        with self._lock:
+            self.fetches.append({
+                "url": url,
+                "transport": transport,
+                "status": status,
+                "seconds": round(seconds, 4),
+                "bytes": size,
+                "cache_hit": cache_hit,
+                "retries": retries,
+            })
+            if cache_hit:
+                self.counters["cache_hits"] += 1
+            self.counters["retries"] += retries
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a top-level stage; profile it when PROFILE_STAGES is set."""
+        start = time.perf_counter()
+        status = "ok"
+        profiler = None
+        try:
+            try:
+                profiler = _start_profiler()
+            except Exception as e:
+                print(f"  Could not start profiler for {name}, profiling disabled: {e}")
+            yield
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            try:
+                profile_path = _stop_profiler(profiler, name)
+            except Exception as e:
+                print(f"  Could not write profile for {name}: {e}")
+                profile_path = None
+            with self._lock:
+                self.stages[name] = {"seconds": round(elapsed, 3), "status": status}
+                if profile_path:
+                    self.stages[name]["profile"] = profile_path
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            fetches = list(self.fetches)
+            by_transport = defaultdict(lambda: {"requests": 0, "seconds": 0.0, "bytes": 0})
+            for fetch in fetches:
+                totals = by_transport[fetch["transport"]]
+                totals["requests"] += 1
+                totals["seconds"] = round(totals["seconds"] + fetch["seconds"], 4)
+                totals["bytes"] += fetch["bytes"]
+            return {
+                "started_at": self.started_at.isoformat(),
+                "finished_at": datetime.now().isoformat(),
+                "total_seconds": round(time.perf_counter() - self._start, 3),
+                "stages": dict(self.stages),
+                "timers": {name: {"count": t["count"], "seconds": round(t["seconds"], 4)}
+                           for name, t in sorted(self.timers.items())},
+                "counters": dict(sorted(self.counters.items())),
+                "transports": dict(by_transport),
+                "hosts": SCHEDULER.summary(),
+                "changed_files": sorted(CHANGED_FILES),
+                "fetches": fetches,
+            }
+
+    def write(self, filename: str = RUN_REPORT_FILE):
+        path = SCRIPT_DIR / filename
+        _write_json_atomic(path, self.to_dict())
+        print(f"Run report: {path}")
+
+
+def _start_profiler():
+    if PROFILE_STAGES == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()  # profiles the calling thread, i.e. this stage only
+        return profiler
+    if PROFILE_STAGES == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("  pyinstrument is not installed, stage profiling disabled")
+            return None
+        profiler = Profiler()
+        profiler.start()
+        return profiler
+    return None
+
+def _stop_profiler(profiler, stage: str) -> Optional[str]:
+    if profiler is None:
+        return None
+    directory = SCRIPT_DIR / ".cache" / "profiles"
+    directory.mkdir(parents=True, exist_ok=True)
+    name = re.sub(r'[^A-Za-z0-9]+', '_', stage).strip('_').lower()
+    if PROFILE_STAGES == "cprofile":
+        profiler.disable()
+        path = directory / f"{name}.prof"
+        profiler.dump_stats(str(path))
+    else:
+        profiler.stop()
+        path = directory / f"{name}.html"
+        path.write_text(profiler.output_html(), encoding='utf-8')
+    return str(path.relative_to(SCRIPT_DIR))
+
+REPORT = RunReport()
+
+class HttpCache:
+    """On-disk HTTP cache keyed by URL, for conditional requests.
+
+    Stores each successful body with its ETag / Last-Modified validators. The
+    next request for that URL sends If-None-Match / If-Modified-Since, and on a
+    304 the stored body is served instead. URLs answered from the cache during
+    this run are remembered, so callers can skip re-parsing unchanged inputs.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._unchanged = set()
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a URL (empty if nothing is cached)."""
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """Remember a 200 response; bodies without validators are not cached."""
+        if not etag and not last_modified:
+            return
+        meta_path, body_path = self._paths(url)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(body)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({"url": url, "etag": etag, "last_modified": last_modified,
+                           "stored_at": datetime.now().isoformat()}, f)
+        except OSError as e:
+            print(f"  Could not cache {url}: {e}")
+
+    def revalidated(self, url: str) -> Optional[bytes]:
+        """Cached body for a URL the server answered with 304 Not Modified."""
+        _, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            self._unchanged.add(url)
+        return body
+
+    def is_unchanged(self, *urls: str) -> bool:
+        """True if every URL was served from the cache (304) during this run."""
+        with self._lock:
+            return all(url in self._unchanged for url in urls)
+
+
+HTTP_CACHE = HttpCache(SCRIPT_DIR / ".cache" / "http")
+
+def _build_http_session() -> requests.Session:
+    """Shared session for every FotMob request.
+
+    Connections are kept alive and pooled per host, and 429/5xx responses are
+    retried with jittered exponential backoff (honouring Retry-After). gzip and,
+    when the `brotli` package is installed, br are negotiated by default.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        backoff_jitter=0.5,
+        # 429 is left to the request scheduler, which slows the host down first
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        raise_on_status=False  # Hand the last response back so callers can report its status
+    )
+    adapter = HTTPAdapter(
+        pool_connections=len(HOST_CONCURRENCY),
+        pool_maxsize=max(HOST_CONCURRENCY.values()),
+        max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+HTTP_SESSION = _build_http_session()
+
+def http_get(url: str, timeout: int = 30) -> requests.Response:
+    """GET through the shared session, paced by the request scheduler.
+
+    Requests are made conditional on the cached validators; a 304 is turned
+    back into a 200 response carrying the cached body.
+    """
+    start = time.perf_counter()
+    retries = 0
+    for attempt in range(THROTTLE_RETRIES + 1):
+        with SCHEDULER.slot(url) as ticket:
+            response = HTTP_SESSION.get(url, headers=HTTP_CACHE.validators(url), timeout=timeout)
+            ticket.report(response.status_code, response.headers.get('Retry-After'))
+        # Retries done inside urllib3 (5xx) plus our own after a 429/403
+        urllib3_retries = getattr(getattr(response.raw, "retries", None), "history", None) or ()
+        retries += len(urllib3_retries)
+        if not ticket.throttled:
+            break
+        if attempt < THROTTLE_RETRIES:
+            retries += 1
+            print(f"  Retrying after {response.status_code}: {url}")
+    REPORT.record_fetch(url, "http", response.status_code, time.perf_counter() - start,
+                        len(response.content or b""), cache_hit=response.status_code == 304, retries=retries)
+    if response.status_code == 304:
+        body = HTTP_CACHE.revalidated(url)
+        if body is not None:
+            print(f"  Not modified, using cached copy: {url}")
+            response.status_code = 200
+            response._content = body
+    elif response.status_code == 200:
+        HTTP_CACHE.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    return response
+
+# Fields that change on every run; ignored when deciding if an output changed
+VOLATILE_FIELDS = {"scraped_at", "age_seconds"}
+
+# Output files actually rewritten during this run
+CHANGED_FILES = []
+_changed_files_lock = threading.Lock()
+
+def _strip_volatile(data):
+    if isinstance(data, dict):
+        return {k: _strip_volatile(v) for k, v in data.items() if k not in VOLATILE_FIELDS}
+    if isinstance(data, list):
+        return [_strip_volatile(v) for v in data]
+    return data
+
+def content_hash(data) -> str:
+    """Hash of a JSON payload, ignoring volatile fields and key order."""
+    canonical = json.dumps(_strip_volatile(data), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _write_json_atomic(path: Path, data):
+    """Write to a temp file and rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files private to the owner
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def save_to_json(data: dict, filename: str) -> bool:
+    """Save data to JSON file, unless only volatile fields changed.
+
+    The file is written to a temp file and renamed into place, so readers never
+    see a half-written output. Returns True if the file was (re)written.
+    """
     path = SCRIPT_DIR / filename
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                unchanged = content_hash(json.load(f)) == content_hash(data)
+        except (OSError, ValueError):
+            unchanged = False
+        if unchanged:
+            print(f"Unchanged JSON, skipped: {path}")
+            return False
+    
+    with REPORT.timer("file_write"):
+        _write_json_atomic(path, data)
+    
+    with _changed_files_lock:
+        CHANGED_FILES.append(filename)
     print(f"Saved JSON: {path}")
+    return True
+
+
+class LastGoodStore:
+    """Last-known-good copies of output sections (stale-while-revalidate).
+
+    Every section that is fetched successfully is snapshotted. When a later
+    fetch fails (empty/None result), the snapshot is served instead, together
+    with a marker giving its age; the next run simply fetches again and
+    refreshes the snapshot. Without a snapshot yet (fresh cache), the section
+    from the previously written output file is used as the seed.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def save(self, name: str, value):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(self._path(name), {"saved_at": datetime.now().isoformat(), "value": value})
+        except OSError as e:
+            print(f"  Could not store last good snapshot {name}: {e}")
+
+    def load(self, name: str) -> Optional[dict]:
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
 
+    def serve(self, name: str, value, is_good, seed=None, expires_at=None):
+        """Return (value, None) for good data, else (snapshot value, stale marker).
+
+        `seed` returns a {"saved_at", "value"} record to use when no snapshot
+        exists. `expires_at(value)` gives a unix time after which a snapshot is
+        no longer worth serving (e.g. a next match that has kicked off).
+        """
+        if is_good(value):
+            self.save(name, value)
+            return value, None
+        
+        record = self.load(name) or (seed() if seed else None)
+        if not record or not is_good(record.get("value")):
+            return value, None
+        expiry = expires_at(record["value"]) if expires_at else None
+        if expiry is not None and expiry < time.time():
+            print(f"  Last good {name} has expired, not serving it")
+            return value, None
+        
+        saved_at = record["saved_at"]
+        try:
+            age = int((datetime.now() - datetime.fromisoformat(saved_at)).total_seconds())
+        except (TypeError, ValueError):
+            age = None
+        print(f"  Fetch failed for {name}, serving last good copy from {saved_at}")
+        return record["value"], {"snapshot_saved_at": saved_at, "age_seconds": age}
+
+LAST_GOOD = LastGoodStore(SCRIPT_DIR / ".cache" / "last_good")
+
+def serve_last_good(output: dict, filename: str, name: str, value, is_good, getter, expires_at=None):
+    """Serve a section of `output` through LAST_GOOD.
+
+    A stale snapshot is recorded under output["stale"][name]. Without a snapshot
+    the section is seeded from the existing `filename` via `getter`; if it was
+    served stale there too, its original snapshot time is kept.
+    """
+    def seed():
+        try:
+            with open(SCRIPT_DIR / filename, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            value = getter(previous)
+        except (OSError, ValueError, KeyError, TypeError, IndexError, StopIteration):
+            return None
+        marker = previous.get("stale", {}).get(name)
+        return {"saved_at": marker["snapshot_saved_at"] if marker else previous.get("scraped_at"), "value": value}
+    
+    value, marker = LAST_GOOD.serve(name, value, is_good, seed, expires_at)
+    if marker:
+        output.setdefault("stale", {})[name] = marker
+    return value
 
 def fetch_content(url: str) -> str:
-    """Fetch content with requests."""
+    """Fetch content through the shared HTTP session."""
     print(f"Fetching {url}...")
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_get(url)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -93,6 +667,7 @@ def fetch_with_playwright(url: str, wait_selector: Optional[str] = None) -> str:
     for strategy in wait_strategies:
         try:
             with sync_playwright() as p:
+                REPORT.count("browser_launches")
                 browser = p.chromium.launch(
                     headless=True,
                     args=['--no-sandbox', '--disable-gpu', '--disable-dev-shm-usage']
@@ -100,7 +675,10 @@ def fetch_with_playwright(url: str, wait_selector: Optional[str] = None) -> str:
                 context = browser.new_context(user_agent=HEADERS['User-Agent'])
                 page = context.new_page()
                 print(f"  Trying wait strategy: {strategy}")
-                page.goto(url, wait_until=strategy, timeout=90000)
+                start = time.perf_counter()
+                with SCHEDULER.slot(url) as ticket:
+                    response = page.goto(url, wait_until=strategy, timeout=90000)
+                    ticket.report(response.status if response else None)
                 
                 if wait_selector:
                     try:
@@ -113,6 +691,8 @@ def fetch_with_playwright(url: str, wait_selector: Optional[str] = None) -> str:
                 
                 content = page.content()
                 browser.close()
+                REPORT.record_fetch(url, "playwright_page", response.status if response else None,
+                                    time.perf_counter() - start, len(content or ""))
                 if content and len(content) > 1000:  # Ensure we got real content
                     return content
                 else:
@@ -125,6 +705,55 @@ def fetch_with_playwright(url: str, wait_selector: Optional[str] = None) -> str:
 
 # --- Parsing Functions (Robust logic) ---
 
+# BeautifulSoup tree builder for FotMob HTML. "auto" uses the C-based "lxml"
+# builder when it is installed (much faster on large rendered team pages) and
+# falls back to the stdlib "html.parser"; either can also be forced.
+HTML_PARSER_BACKEND = "auto"
+
+def make_soup(html_content: str, backend: Optional[str] = None) -> BeautifulSoup:
+    backend = backend or HTML_PARSER_BACKEND
+    if backend == "auto":
+        backend = "lxml" if lxml is not None else "html.parser"
+    with REPORT.timer("html_parse"):
+        return BeautifulSoup(html_content, backend)
+
+STANDINGS_VIEWS = ("all", "home", "away")
+
+def _league_header(data: dict) -> dict:
+    """League name/logo/url for one entry of the Team API `table` list."""
+    league_id = data.get("leagueId")
+    return {
+        "name": data.get("leagueName", "Unknown League"),
+        "logo": f"https://images.fotmob.com/image_resources/logo/leaguelogo/{league_id}.png" if league_id else None,
+        "url": f"https://www.fotmob.com{data.get('pageUrl')}" if data.get('pageUrl') else None
+    }
+
+def _team_ref(row: dict) -> dict:
+    return {
+        "id": str(row.get("id")),
+        "name": row.get("name"),
+        "logo": f"https://images.fotmob.com/image_resources/logo/teamlogo/{row.get('id')}.png",
+        "url": f"https://www.fotmob.com{row.get('pageUrl')}" if row.get('pageUrl') else None
+    }
+
+def _standings_row(row: dict, team: dict) -> dict:
+    scores = row.get("scoresStr", "0-0").split("-")
+    gs = int(scores[0]) if len(scores) > 0 else 0
+    gc = int(scores[1]) if len(scores) > 1 else 0
+    
+    return {
+        "position": row.get("idx"),
+        "team": team,
+        "played": row.get("played", 0),
+        "won": row.get("wins", 0),
+        "drawn": row.get("draws", 0),
+        "lost": row.get("losses", 0),
+        "gs": gs,
+        "gc": gc,
+        "gd": row.get("goalConDiff", 0),
+        "pts": row.get("pts", 0)
+    }
+
 def parse_standings_from_api(api_data: dict, table_type: str = "all") -> dict:
     """Parse standings from FotMob Team API response, supporting both single-table and composite groups."""
     standings = {"scraped_at": datetime.now().isoformat(), "leagues": []}
@@ -134,44 +763,10 @@ def parse_standings_from_api(api_data: dict, table_type: str = "all") -> dict:
         
     for table_entry in api_data["table"]:
         data = table_entry.get("data", {})
-        league_name = data.get("leagueName", "Unknown League")
-        league_id = data.get("leagueId")
-        league_url = f"https://www.fotmob.com{data.get('pageUrl')}" if data.get('pageUrl') else None
-        league_logo = f"https://images.fotmob.com/image_resources/logo/leaguelogo/{league_id}.png" if league_id else None
-        
-        league_data = {
-            "name": league_name,
-            "logo": league_logo,
-            "url": league_url,
-            "groups": [],
-            "teams": []
-        }
+        league_data = {**_league_header(data), "groups": [], "teams": []}
 
         def process_rows(rows_data):
-            teams_list = []
-            for row in rows_data:
-                scores = row.get("scoresStr", "0-0").split("-")
-                gs = int(scores[0]) if len(scores) > 0 else 0
-                gc = int(scores[1]) if len(scores) > 1 else 0
-                
-                teams_list.append({
-                    "position": row.get("idx"),
-                    "team": {
-                        "id": str(row.get("id")),
-                        "name": row.get("name"),
-                        "logo": f"https://images.fotmob.com/image_resources/logo/teamlogo/{row.get('id')}.png",
-                        "url": f"https://www.fotmob.com{row.get('pageUrl')}" if row.get('pageUrl') else None
-                    },
-                    "played": row.get("played", 0),
-                    "won": row.get("wins", 0),
-                    "drawn": row.get("draws", 0),
-                    "lost": row.get("losses", 0),
-                    "gs": gs,
-                    "gc": gc,
-                    "gd": row.get("goalConDiff", 0),
-                    "pts": row.get("pts", 0)
-                })
-            return teams_list
+            return [_standings_row(row, _team_ref(row)) for row in rows_data]
         
         # 1. Check for standard single table
         table_obj = data.get("table", {})
@@ -195,20 +790,126 @@ def parse_standings_from_api(api_data: dict, table_type: str = "all") -> dict:
             
     return standings
 
+def parse_standings_views_from_api(api_data: dict) -> dict:
+    """Parse every standings view from the Team API in a single pass.
+
+    Returns {"all": ..., "home": ..., "away": ..., "index": ..., "persib": ...}:
+    the three views in the same shape as parse_standings_from_api(), a
+    StandingsIndex over the "all" view, and Persib's extracted rows. League
+    headers and team objects are built once and shared by all views.
+    """
+    scraped_at = datetime.now().isoformat()
+    result = {view: {"scraped_at": scraped_at, "leagues": []} for view in STANDINGS_VIEWS}
+    index = StandingsIndex(scraped_at)
+    
+    teams = {}  # FotMob team id -> shared team object
+    
+    def process_rows(rows_data):
+        teams_list = []
+        for row in rows_data:
+            team = teams.get(row.get("id"))
+            if team is None:
+                team = teams[row.get("id")] = _team_ref(row)
+            teams_list.append(_standings_row(row, team))
+        return teams_list
+    
+    for table_entry in api_data.get("table") or []:
+        data = table_entry.get("data", {})
+        header = _league_header(data)
+        leagues = {view: {**header, "groups": [], "teams": []} for view in STANDINGS_VIEWS}
+        
+        # 1. Check for standard single table
+        table_obj = data.get("table", {})
+        if table_obj:
+            for view in STANDINGS_VIEWS:
+                leagues[view]["teams"] = process_rows(table_obj.get(view, []))
+        
+        # 2. Check for composite tables (groups)
+        elif "tables" in data and isinstance(data["tables"], list):
+            for group_table in data["tables"]:
+                g_name = group_table.get("leagueName", "Unknown Group")
+                g_table = group_table.get("table", {})
+                for view in STANDINGS_VIEWS:
+                    g_rows = g_table.get(view, [])
+                    if g_rows:
+                        leagues[view]["groups"].append({
+                            "name": g_name,
+                            "teams": process_rows(g_rows)
+                        })
+        
+        for view in STANDINGS_VIEWS:
+            league = leagues[view]
+            if league["teams"] or league["groups"]:
+                result[view]["leagues"].append(league)
+        
+        # Index the "all" view, groups first as StandingsIndex.from_standings does
+        for group in leagues["all"]["groups"]:
+            for row in group["teams"]:
+                index.add(header, group["name"], row)
+        for row in leagues["all"]["teams"]:
+            index.add(header, None, row)
+    
+    result["index"] = index
+    result["persib"] = index.extract(TEAM_ID, "Persib Bandung")
+    return result
+
+def normalize_team_name(name: str) -> str:
+    return " ".join((name or "").lower().split())
+
+class StandingsIndex:
+    """Standings rows indexed by team id and normalized team name.
+
+    Built while parsing, so any team's rows across all leagues and groups are a
+    dictionary lookup instead of a scan of every table.
+    """
+
+    def __init__(self, scraped_at: Optional[str] = None):
+        self.scraped_at = scraped_at
+        self.by_id = defaultdict(list)
+        self.ids_by_name = {}
+
+    @classmethod
+    def from_standings(cls, standings: dict) -> "StandingsIndex":
+        index = cls(standings.get("scraped_at"))
+        for league in standings.get("leagues", []):
+            for group in league.get("groups", []):
+                for team in group.get("teams", []):
+                    index.add(league, group["name"], team)
+            for team in league.get("teams", []):
+                index.add(league, None, team)
+        return index
+
+    def add(self, league: dict, group_name: Optional[str], row: dict):
+        team_id = row["team"]["id"]
+        self.by_id[team_id].append({"league": league["name"], "group": group_name, "league_logo": league["logo"], **row})
+        self.ids_by_name.setdefault(normalize_team_name(row["team"]["name"]), team_id)
+
+    def team_ids(self) -> List[str]:
+        return list(self.by_id)
+
+    def resolve(self, team: str) -> Optional[str]:
+        """Team id for a FotMob team id or team name."""
+        team = str(team)
+        if team in self.by_id:
+            return team
+        return self.ids_by_name.get(normalize_team_name(team))
+
+    def extract(self, team: str, team_name: Optional[str] = None) -> dict:
+        """Standings document for one team, in the persib_standings.json shape."""
+        team_id = self.resolve(team)
+        rows = self.by_id.get(team_id, []) if team_id else []
+        if team_name is None:
+            team_name = rows[0]["team"]["name"] if rows else str(team)
+        return {"scraped_at": self.scraped_at, "team": team_name, "standings": list(rows)}
+
+def team_standings_filename(team_id: str) -> str:
+    return f"standings_team_{team_id}.json"
+
 def extract_persib_standings(standings: dict) -> dict:
-    persib_data = {"scraped_at": standings.get("scraped_at"), "team": "Persib Bandung", "standings": []}
-    for league in standings.get("leagues", []):
-        for group in league.get("groups", []):
-            for team in group.get("teams", []):
-                if "Persib" in team["team"]["name"]:
-                    persib_data["standings"].append({"league": league["name"], "group": group["name"], "league_logo": league["logo"], **team})
-        for team in league.get("teams", []):
-            if "Persib" in team["team"]["name"]:
-                persib_data["standings"].append({"league": league["name"], "group": None, "league_logo": league["logo"], **team})
-    return persib_data
-
-def parse_fixtures_from_html(html_content: str) -> dict:
-    soup = BeautifulSoup(html_content, 'html.parser')
+    return StandingsIndex.from_standings(standings).extract(TEAM_ID, "Persib Bandung")
+
+def parse_fixtures_from_html(html_content: str, backend: Optional[str] = None) -> dict:
+    soup = make_soup(html_content, backend)
     fixtures_data = {
         "scraped_at": datetime.now().isoformat(),
         "fixtures": [],
@@ -245,7 +946,8 @@ def parse_fixtures_from_html(html_content: str) -> dict:
             if match_url in seen_urls: continue
             
             # Skip links that are just icons or team logos if they don't have enough data
-            if not link.select_one('span[class*="TeamName"]'): continue
+            team_elems = link.select('span[class*="TeamName"]')
+            if not team_elems: continue
 
             date_elem = link.select_one('span[class*="StartDate"]')
             date_str = date_elem.get_text(strip=True) if date_elem else ""
@@ -259,11 +961,6 @@ def parse_fixtures_from_html(html_content: str) -> dict:
                 logo_elem = league_container.select_one('img')
                 if logo_elem: league_logo = logo_elem['src']
             
-            team_elems = link.select('span[class*="TeamName"]')
-            # Handle NextMatchContainerCSS structure which might use different classes
-            if not team_elems:
-                team_elems = link.select('div[class*="TeamNameCSS"]')
-                
             home_team = team_elems[0].get_text(strip=True) if len(team_elems) >= 1 else "Unknown"
             away_team = team_elems[1].get_text(strip=True) if len(team_elems) >= 2 else "Unknown"
             
@@ -340,9 +1037,9 @@ def parse_fixtures_from_html(html_content: str) -> dict:
 
     return fixtures_data
 
-def parse_head_to_head(html_content: str) -> dict:
+def parse_head_to_head(html_content: str, backend: Optional[str] = None) -> dict:
     """Parse head-to-head data from the H2H tab of a match page."""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content, backend)
     h2h_data = {
         "summary": None,
         "matches": []
@@ -469,9 +1166,10 @@ def parse_player_stats() -> Dict:
     for key, api_stat_name in stat_types.items():
         print(f"Fetching API stats: {key}...")
         try:
-            response = requests.get(f"{base_api}&stat={api_stat_name}", headers=HEADERS, timeout=30)
+            response = http_get(f"{base_api}&stat={api_stat_name}")
             if response.status_code == 200:
-                json_data = response.json()
+                with REPORT.timer("json_parse"):
+                    json_data = response.json()
                 # Use the existing parse_top_stats_from_json to process the fetched data
                 all_stats[key] = parse_top_stats_from_json(json_data, key)
             else:
@@ -560,12 +1258,29 @@ def parse_top_stats_from_json(json_data: dict, stat_type: str, team_name: str =
         except: continue
     return stats_list
 
-def fetch_json_with_playwright(url: str) -> dict:
-    """Fetch JSON content with Playwright (useful for APIs blocked by standard requests)."""
-    print(f"Fetching JSON with Playwright: {url}...")
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
+# --- Shared Playwright Browser (Sofascore) ---
+
+class BrowserPool:
+    """Long-lived Playwright browser shared by every Sofascore fetch in a run.
+
+    Chromium is launched and the Sofascore homepage is warmed up only once, on
+    first use. All pages handed out live in the same context, so the cookies set
+    during warmup are reused by every request. Playwright's sync API is bound to
+    the thread that started it: acquire, release and close from one thread.
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle_pages = []
+
+    def _start(self):
+        print("Launching shared Playwright browser...")
+        REPORT.count("browser_launches")
+        with REPORT.timer("browser_launch"):
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(
                 headless=True,
                 args=[
                     '--no-sandbox', 
@@ -574,57 +1289,447 @@ def fetch_json_with_playwright(url: str) -> dict:
                     '--disable-blink-features=AutomationControlled'  # Stealth arg
                 ]
             )
-            context = browser.new_context(
-                user_agent=HEADERS['User-Agent'],
-                viewport={'width': 1920, 'height': 1080}
-            )
-            
-            # Stealth: inject script to hide webdriver property
-            context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            page = context.new_page()
-            
-            # Warmup: Visit homepage first to set cookies/session
+        self._context = self._browser.new_context(
+            user_agent=HEADERS['User-Agent'],
+            viewport={'width': 1920, 'height': 1080}
+        )
+        
+        # Stealth: inject script to hide webdriver property
+        self._context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        page = self._context.new_page()
+        self._warmup(page, settle_ms=2000)
+        self._idle_pages.append(page)
+
+    def _warmup(self, page, settle_ms: int = 0):
+        # Warmup: Visit homepage first to set cookies/session. It also gives the
+        # page a sofascore.com origin, which in-page fetch() calls rely on.
+        try:
+            print("  Warmup: Visiting homepage...")
+            with REPORT.timer("browser_warmup"):
+                with SCHEDULER.slot("https://www.sofascore.com") as ticket:
+                    response = page.goto("https://www.sofascore.com", wait_until="domcontentloaded", timeout=30000)
+                    ticket.report(response.status if response else None)
+                if settle_ms:
+                    page.wait_for_timeout(settle_ms)
+        except Exception as e:
+            print(f"  Warmup failed (continuing): {e}")
+
+    def acquire(self):
+        """Hand out a warmed page, launching the browser on first use."""
+        if self._context is None:
+            self._start()
+        if self._idle_pages:
+            return self._idle_pages.pop()
+        # Cookies are already set on the context, so no settle wait is needed
+        page = self._context.new_page()
+        self._warmup(page)
+        return page
+
+    def release(self, page, broken: bool = False):
+        """Return a page to the pool, or discard it if it is no longer usable."""
+        if broken or page.is_closed():
             try:
-                print("  Warmup: Visiting homepage...")
-                page.goto("https://www.sofascore.com", wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(2000)
-            except Exception as e:
-                print(f"  Warmup failed (continuing): {e}")
-            
-            # Use domcontentloaded instead of networkidle for reliability
-            response = page.goto(url, wait_until="domcontentloaded", timeout=90000)
-            
-            # Check if response was successful
-            if not response or not response.ok:
-                print(f"  Playwright response not OK: {response.status if response else 'No Response'}")
-                browser.close()
-                return {}
-
-            # Get the text content, which should be the JSON string
-            # Sometimes APIs return HTML-wrapped JSON (e.g. <pre>...</pre>), so we handle that:
-            content = page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            # Try to find JSON in body text or pre tag
-            body_text = soup.get_text()
-            
-            # Attempt to parse
+                page.close()
+            except Exception:
+                pass
+            return
+        self._idle_pages.append(page)
+
+    @contextmanager
+    def page(self):
+        page = self.acquire()
+        broken = False
+        try:
+            yield page
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(page, broken)
+
+    def close(self):
+        """Shut down the browser; the next acquire() starts a fresh one."""
+        if self._context is None:
+            return
+        try:
+            self._browser.close()
+            self._playwright.stop()
+        except Exception as e:
+            print(f"  Error closing Playwright browser: {e}")
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle_pages = []
+
+
+BROWSER_POOL = BrowserPool()
+
+# How Sofascore JSON is loaded: "fetch" calls the endpoint with fetch() from the
+# warmed page and parses the raw body; "navigate" loads it as a document and
+# re-parses the rendered HTML (slower, kept as a fallback).
+SOFASCORE_TRANSPORT = "fetch"
+
+# Runs inside the page: all requests are sent at once and awaited together.
+# Cached validators are sent as conditional headers; if that request itself
+# fails (e.g. the headers are refused by CORS) it is retried plainly and the
+# result is flagged, so the host gets no more validators for the rest of the run.
+FETCH_JSON_SCRIPT = """async (requests) => Promise.all(requests.map(async ({url, headers}) => {
+    const get = (extra) => fetch(url, {credentials: 'include', headers: {'Accept': 'application/json', ...extra}});
+    try {
+        let resp;
+        let conditionalRefused = false;
+        try {
+            resp = await get(headers);
+        } catch (e) {
+            if (Object.keys(headers).length === 0) throw e;
+            conditionalRefused = true;
+            resp = await get({});
+        }
+        return {
+            status: resp.status,
+            body: resp.status === 304 ? null : await resp.text(),
+            etag: resp.headers.get('ETag'),
+            lastModified: resp.headers.get('Last-Modified'),
+            conditionalRefused
+        };
+    } catch (e) {
+        return {status: 0, error: String(e)};
+    }
+}))"""
+
+def _fetch_json_by_navigation(page, url: str) -> dict:
+    """Load a JSON endpoint as a document and parse it back out of the page."""
+    # Use domcontentloaded instead of networkidle for reliability
+    start = time.perf_counter()
+    with SCHEDULER.slot(url) as ticket:
+        response = page.goto(url, wait_until="domcontentloaded", timeout=90000)
+        ticket.report(response.status if response else None)
+    
+    # Check if response was successful
+    if not response or not response.ok:
+        REPORT.record_fetch(url, "playwright_navigation", response.status if response else None,
+                            time.perf_counter() - start)
+        print(f"  Playwright response not OK: {response.status if response else 'No Response'}")
+        return {}
+
+    # Get the text content, which should be the JSON string
+    # Sometimes APIs return HTML-wrapped JSON (e.g. <pre>...</pre>), so we handle that:
+    content = page.content()
+    REPORT.record_fetch(url, "playwright_navigation", response.status, time.perf_counter() - start, len(content))
+    with REPORT.timer("html_parse"):
+        soup = BeautifulSoup(content, 'html.parser')
+    # Try to find JSON in body text or pre tag
+    body_text = soup.get_text()
+    
+    # Attempt to parse
+    try:
+        return json.loads(body_text)
+    except json.JSONDecodeError:
+        # If direct body text fails, maybe it's inside a <pre>?
+        pre = soup.find('pre')
+        if pre:
+            return json.loads(pre.get_text())
+        print("  Could not parse JSON from Playwright content")
+        return {}
+
+# Marks an in-page fetch answered with 429/403, to be retried after the slow-down
+_THROTTLED = object()
+
+# Hosts that refused a conditional in-page fetch (CORS preflight) this run
+_NO_VALIDATOR_HOSTS = set()
+_no_validator_lock = threading.Lock()
+
+def _in_page_validators(url: str) -> Dict[str, str]:
+    """Conditional headers for an in-page fetch, unless the host refused them."""
+    with _no_validator_lock:
+        if urlparse(url).netloc in _NO_VALIDATOR_HOSTS:
+            return {}
+    return HTTP_CACHE.validators(url)
+
+def _fetch_json_in_page(page, urls: List[str]) -> List[Optional[dict]]:
+    """Request all URLs concurrently with fetch() from inside the page.
+
+    Every URL holds a scheduler slot while the batch is in flight. Returns one
+    entry per URL: the parsed JSON, {} for an HTTP error or bad body, _THROTTLED
+    for a 429/403, or None when the fetch() itself failed (network/CORS) and
+    navigation should be tried instead.
+    """
+    requests_spec = [{"url": url, "headers": _in_page_validators(url)} for url in urls]
+    tickets = []
+    try:
+        for url in urls:
+            tickets.append(SCHEDULER.acquire(url))
+        start = time.perf_counter()
+        responses = page.evaluate(FETCH_JSON_SCRIPT, requests_spec)
+        # Requests of one batch run concurrently: each gets the batch's latency
+        elapsed = time.perf_counter() - start
+        for url, ticket, res in zip(urls, tickets, responses):
+            status = res.get("status") or None
+            ticket.report(status)
+            if res.get("conditionalRefused"):
+                host = urlparse(url).netloc
+                with _no_validator_lock:
+                    if host not in _NO_VALIDATOR_HOSTS:
+                        print(f"  Conditional headers refused by {host}, not sending them again this run")
+                    _NO_VALIDATOR_HOSTS.add(host)
+            REPORT.record_fetch(url, "playwright_fetch", status, elapsed,
+                                len((res.get("body") or "").encode('utf-8')), cache_hit=status == 304)
+    finally:
+        for ticket in tickets:
+            SCHEDULER.release(ticket)
+    
+    results = []
+    for url, ticket, res in zip(urls, tickets, responses):
+        status = res.get("status", 0)
+        body = res.get("body")
+        if ticket.throttled:
+            results.append(_THROTTLED)
+            continue
+        if status == 304:
+            cached = HTTP_CACHE.revalidated(url)
+            if cached is None:
+                results.append(None)
+                continue
+            print(f"  Not modified, using cached copy: {url}")
+            body = cached.decode('utf-8')
+        elif status == 200:
+            HTTP_CACHE.store(url, (body or "").encode('utf-8'), res.get("etag"), res.get("lastModified"))
+        
+        if status == 0:
+            print(f"  In-page fetch failed for {url}: {res.get('error')}")
+            results.append(None)
+        elif status >= 400:
+            print(f"  Playwright response not OK: {status} ({url})")
+            results.append({})
+        else:
             try:
-                data = json.loads(body_text)
+                with REPORT.timer("json_parse"):
+                    results.append(json.loads(body or "{}"))
             except json.JSONDecodeError:
-                # If direct body text fails, maybe it's inside a <pre>?
-                pre = soup.find('pre')
-                if pre:
-                    data = json.loads(pre.get_text())
-                else:
-                    print("  Could not parse JSON from Playwright content")
-                    data = {}
+                print(f"  Could not parse JSON from {url}")
+                results.append({})
+    return results
+
+def _host_chunks(urls: List[str], indices: List[int]) -> List[List[int]]:
+    """Split `indices` into same-host chunks of at most the host's concurrency limit."""
+    by_host = defaultdict(list)
+    for i in indices:
+        by_host[urlparse(urls[i]).netloc].append(i)
+    chunks = []
+    for host, group in by_host.items():
+        limit = HOST_CONCURRENCY.get(host, 4)
+        chunks.extend(group[start:start + limit] for start in range(0, len(group), limit))
+    return chunks
+
+def fetch_json_batch(urls: List[str]) -> List[dict]:
+    """Fetch several Sofascore JSON endpoints through the shared browser.
+
+    With the "fetch" transport every URL is in flight at the same time from one
+    page. Results are returned in the same order as `urls`, {} on failure.
+    """
+    if not urls:
+        return []
+    for url in urls:
+        print(f"Fetching JSON with Playwright: {url}...")
+    try:
+        with BROWSER_POOL.page() as page:
+            results = [None] * len(urls)
+            if SOFASCORE_TRANSPORT == "fetch":
+                # Each chunk holds one host's URLs, at most that host's concurrency
+                # limit: _fetch_json_in_page takes all of a chunk's slots up front,
+                # so a bigger chunk would wait on slots it is holding itself.
+                # Throttled URLs are retried once the scheduler has slowed down.
+                pending = list(range(len(urls)))
+                try:
+                    for attempt in range(THROTTLE_RETRIES + 1):
+                        for chunk in _host_chunks(urls, pending):
+                            for i, result in zip(chunk, _fetch_json_in_page(page, [urls[i] for i in chunk])):
+                                results[i] = result
+                        pending = [i for i in pending if results[i] is _THROTTLED]
+                        if not pending:
+                            break
+                        if attempt < THROTTLE_RETRIES:
+                            print(f"  Retrying {len(pending)} throttled request(s)")
+                except Exception as e:
+                    print(f"  In-page fetch error, falling back to navigation: {e}")
             
-            browser.close()
-            return data
+            for i, url in enumerate(urls):
+                if results[i] is _THROTTLED:
+                    print(f"  Still throttled, giving up: {url}")
+                    results[i] = {}
+                if results[i] is not None:
+                    continue
+                try:
+                    results[i] = _fetch_json_by_navigation(page, url)
+                except Exception as e:
+                    print(f"  Playwright JSON error fetching {url}: {e}")
+                    results[i] = {}
+            return results
     except Exception as e:
-        print(f"  Playwright JSON error fetching {url}: {e}")
-        return {}
+        print(f"  Playwright JSON error: {e}")
+        return [{} for _ in urls]
+
+def fetch_json_with_playwright(url: str) -> dict:
+    """Fetch JSON content with Playwright (useful for APIs blocked by standard requests)."""
+    return fetch_json_batch([url])[0]
+
+class TeamStatisticsService:
+    """Memoized Sofascore `statistics/overall` lookups for this run.
+
+    Keyed by (team id, tournament id, season id). Tuples that are not cached yet
+    are fetched together with one fetch_json_batch call, so they are in flight at
+    the same time. A successful response is fetched at most once per run; a
+    failure ({}) is not remembered, so the next get_many asks for it again.
+    Used from the Sofascore thread only, like the browser pool.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._results = {}
+
+    @staticmethod
+    def key(team_id, tournament_id, season_id) -> tuple:
+        return (str(team_id), str(tournament_id), str(season_id))
+
+    @staticmethod
+    def url(key: tuple) -> str:
+        team_id, tournament_id, season_id = key
+        return f"https://api.sofascore.com/api/v1/team/{team_id}/unique-tournament/{tournament_id}/season/{season_id}/statistics/overall"
+
+    def get_many(self, keys: List[tuple]) -> List[dict]:
+        """Raw statistics responses for (team, tournament, season) tuples, in order."""
+        keys = [self.key(*k) for k in keys]
+        missing = list(dict.fromkeys(k for k in keys if k not in self._results))
+        fetched = {}
+        if missing:
+            for k, data in zip(missing, fetch_json_batch([self.url(k) for k in missing])):
+                fetched[k] = data or {}
+                if data:
+                    self._results[k] = data
+        else:
+            print(f"  Team statistics served from run cache ({len(keys)} lookups)")
+        return [self._results.get(k, fetched.get(k, {})) for k in keys]
+
+    def get(self, team_id, tournament_id, season_id) -> dict:
+        return self.get_many([(team_id, tournament_id, season_id)])[0]
+
+
+TEAM_STATISTICS = TeamStatisticsService()
+
+STATISTICS_SECTIONS = ["summary", "attacking", "passes", "defending", "other"]
+
+def parse_team_statistics(stats: dict) -> dict:
+    """Map a Sofascore `statistics` object to our sections (summary, attacking, ...)."""
+    sections = {}
+    
+    # Use None for fields not available in the API response
+    # (ISL API returns fewer fields than AFC, so None = not available)
+    
+    # Parse Summary
+    sections["summary"] = {
+        "matches": stats.get("matches", 0),
+        "goals_scored": stats.get("goalsScored", 0),
+        "goals_conceded": stats.get("goalsConceded", 0),
+        "assists": stats.get("assists", 0),
+        "awarded_matches": stats.get("awardedMatches", 0),
+        "rating": stats.get("avgRating"),
+        "shots_against": stats.get("shotsAgainst")
+    }
+    
+    # Parse Attacking stats
+    matches = max(stats.get("matches", 1), 1)
+    sections["attacking"] = {
+        "goals_per_game": round(stats.get("goalsScored", 0) / matches, 2),
+        "penalty_goals": stats.get("penaltyGoals"),
+        "penalties_taken": stats.get("penaltiesTaken"),
+        "total_shots": stats.get("shots"),
+        "shots_on_target": stats.get("shotsOnTarget"),
+        "shots_off_target": stats.get("shotsOffTarget"),
+        "blocked_shots": stats.get("blockedScoringAttempt"),
+        "shots_inside_box": stats.get("shotsFromInsideTheBox"),
+        "shots_outside_box": stats.get("shotsFromOutsideTheBox"),
+        "goals_inside_box": stats.get("goalsFromInsideTheBox"),
+        "goals_outside_box": stats.get("goalsFromOutsideTheBox"),
+        "left_foot_goals": stats.get("leftFootGoals"),
+        "right_foot_goals": stats.get("rightFootGoals"),
+        "headed_goals": stats.get("headedGoals"),
+        "big_chances_created": stats.get("bigChancesCreated"),
+        "big_chances_scored": stats.get("bigChancesScored"),
+        "big_chances_missed": stats.get("bigChancesMissed"),
+        "successful_dribbles": stats.get("successfulDribbles"),
+        "dribble_attempts": stats.get("dribbleAttempts"),
+        "corners": stats.get("corners"),
+        "free_kicks": stats.get("freeKicks") if stats.get("freeKicks") else stats.get("freeKickShots"),
+        "hit_woodwork": stats.get("hitWoodwork"),
+        "offsides": stats.get("offsides")
+    }
+    
+    # Parse Passes stats
+    sections["passes"] = {
+        "ball_possession": stats.get("averageBallPossession"),
+        "total_passes": stats.get("totalPasses"),
+        "accurate_passes": stats.get("accuratePasses"),
+        "accurate_passes_pct": stats.get("accuratePassesPercentage"),
+        "long_balls": stats.get("totalLongBalls"),
+        "accurate_long_balls": stats.get("accurateLongBalls"),
+        "accurate_long_balls_pct": stats.get("accurateLongBallsPercentage"),
+        "crosses": stats.get("totalCrosses"),
+        "accurate_crosses": stats.get("accurateCrosses"),
+        "accurate_crosses_pct": stats.get("accurateCrossesPercentage"),
+        "passes_own_half": stats.get("totalOwnHalfPasses"),
+        "accurate_passes_own_half": stats.get("accurateOwnHalfPasses"),
+        "accurate_passes_own_half_pct": stats.get("accurateOwnHalfPassesPercentage"),
+        "passes_opposition_half": stats.get("totalOppositionHalfPasses"),
+        "accurate_passes_opposition_half": stats.get("accurateOppositionHalfPasses"),
+        "accurate_passes_opposition_half_pct": stats.get("accurateOppositionHalfPassesPercentage")
+    }
+    
+    # Parse Defending stats
+    sections["defending"] = {
+        "clean_sheets": stats.get("cleanSheets"),
+        "goals_conceded_per_game": round(stats.get("goalsConceded", 0) / matches, 2),
+        "tackles": stats.get("tackles"),
+        "interceptions": stats.get("interceptions"),
+        "saves": stats.get("saves"),
+        "clearances": stats.get("clearances"),
+        "clearances_off_line": stats.get("clearancesOffLine"),
+        "balls_recovered": stats.get("ballRecovery"),
+        "errors_leading_to_shot": stats.get("errorsLeadingToShot"),
+        "errors_leading_to_goal": stats.get("errorsLeadingToGoal"),
+        "penalties_committed": stats.get("penaltiesCommited"),
+        "last_man_tackles": stats.get("lastManTackles")
+    }
+    
+    # Parse Other stats
+    total_duels = stats.get("totalDuels")
+    duels_won = stats.get("duelsWon")
+    sections["other"] = {
+        "total_duels": total_duels,
+        "duels_won": duels_won,
+        "duels_lost": (total_duels - duels_won) if total_duels is not None and duels_won is not None else None,
+        "duels_won_pct": stats.get("duelsWonPercentage"),
+        "total_aerial_duels": stats.get("totalAerialDuels"),
+        "aerial_duels_won": stats.get("aerialDuelsWon"),
+        "aerial_duels_won_pct": stats.get("aerialDuelsWonPercentage"),
+        "ground_duels_won": stats.get("groundDuelsWon"),
+        "ground_duels_won_pct": stats.get("groundDuelsWonPercentage"),
+        "yellow_cards": stats.get("yellowCards"),
+        "yellow_red_cards": stats.get("yellowRedCards"),
+        "red_cards": stats.get("redCards"),
+        "fouls": stats.get("fouls"),
+        "throw_ins": stats.get("throwIns"),
+        "goal_kicks": stats.get("goalKicks"),
+        "possession_lost": stats.get("possessionLost")
+    }
+    
+    # Filter out None values from each section (only keep fields with actual data)
+    for section in STATISTICS_SECTIONS:
+        sections[section] = {k: v for k, v in sections[section].items() if v is not None}
+    
+    return sections
 
 def fetch_sofascore_team_statistics() -> dict:
     """Fetch team statistics from Sofascore API for all competitions."""
@@ -635,14 +1740,19 @@ def fetch_sofascore_team_statistics() -> dict:
         "competitions": []
     }
     
-    for competition in SOFASCORE_COMPETITIONS:
+    # All competitions in one batch; tuples already fetched this run (e.g. the
+    # league stats used for the next match) come from the run cache
+    responses = TEAM_STATISTICS.get_many([
+        (SOFASCORE_TEAM_ID, c["tournament_id"], c["season_id"]) for c in SOFASCORE_COMPETITIONS
+    ])
+    
+    for competition, data in zip(SOFASCORE_COMPETITIONS, responses):
         comp_name = competition["name"]
         tournament_id = competition["tournament_id"]
         season_id = competition["season_id"]
         season_name = competition["season_name"]
         
-        api_url = f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/unique-tournament/{tournament_id}/season/{season_id}/statistics/overall"
-        print(f"Fetching Sofascore statistics for {comp_name} ({season_name})...")
+        print(f"Parsing Sofascore statistics for {comp_name} ({season_name})...")
         
         comp_stats = {
             "name": comp_name,
@@ -657,137 +1767,223 @@ def fetch_sofascore_team_statistics() -> dict:
         }
         
         try:
-            # Use Playwright instead of requests to avoid 403
-            data = fetch_json_with_playwright(api_url)
-            
             if not data:
                 print(f"  Failed to fetch {comp_name} (Empty Data)")
                 all_stats["competitions"].append(comp_stats)
                 continue
             
             stats = data.get("statistics", {})
-            
-            # Use None for fields not available in the API response
-            # (ISL API returns fewer fields than AFC, so None = not available)
-            
-            # Parse Summary
-            comp_stats["summary"] = {
-                "matches": stats.get("matches", 0),
-                "goals_scored": stats.get("goalsScored", 0),
-                "goals_conceded": stats.get("goalsConceded", 0),
-                "assists": stats.get("assists", 0),
-                "awarded_matches": stats.get("awardedMatches", 0),
-                "rating": stats.get("avgRating"),
-                "shots_against": stats.get("shotsAgainst")
-            }
-            
-            # Parse Attacking stats
-            matches = max(stats.get("matches", 1), 1)
-            comp_stats["attacking"] = {
-                "goals_per_game": round(stats.get("goalsScored", 0) / matches, 2),
-                "penalty_goals": stats.get("penaltyGoals"),
-                "penalties_taken": stats.get("penaltiesTaken"),
-                "total_shots": stats.get("shots"),
-                "shots_on_target": stats.get("shotsOnTarget"),
-                "shots_off_target": stats.get("shotsOffTarget"),
-                "blocked_shots": stats.get("blockedScoringAttempt"),
-                "shots_inside_box": stats.get("shotsFromInsideTheBox"),
-                "shots_outside_box": stats.get("shotsFromOutsideTheBox"),
-                "goals_inside_box": stats.get("goalsFromInsideTheBox"),
-                "goals_outside_box": stats.get("goalsFromOutsideTheBox"),
-                "left_foot_goals": stats.get("leftFootGoals"),
-                "right_foot_goals": stats.get("rightFootGoals"),
-                "headed_goals": stats.get("headedGoals"),
-                "big_chances_created": stats.get("bigChancesCreated"),
-                "big_chances_scored": stats.get("bigChancesScored"),
-                "big_chances_missed": stats.get("bigChancesMissed"),
-                "successful_dribbles": stats.get("successfulDribbles"),
-                "dribble_attempts": stats.get("dribbleAttempts"),
-                "corners": stats.get("corners"),
-                "free_kicks": stats.get("freeKicks") if stats.get("freeKicks") else stats.get("freeKickShots"),
-                "hit_woodwork": stats.get("hitWoodwork"),
-                "offsides": stats.get("offsides")
-            }
-            
-            # Parse Passes stats
-            comp_stats["passes"] = {
-                "ball_possession": stats.get("averageBallPossession"),
-                "total_passes": stats.get("totalPasses"),
-                "accurate_passes": stats.get("accuratePasses"),
-                "accurate_passes_pct": stats.get("accuratePassesPercentage"),
-                "long_balls": stats.get("totalLongBalls"),
-                "accurate_long_balls": stats.get("accurateLongBalls"),
-                "accurate_long_balls_pct": stats.get("accurateLongBallsPercentage"),
-                "crosses": stats.get("totalCrosses"),
-                "accurate_crosses": stats.get("accurateCrosses"),
-                "accurate_crosses_pct": stats.get("accurateCrossesPercentage"),
-                "passes_own_half": stats.get("totalOwnHalfPasses"),
-                "accurate_passes_own_half": stats.get("accurateOwnHalfPasses"),
-                "accurate_passes_own_half_pct": stats.get("accurateOwnHalfPassesPercentage"),
-                "passes_opposition_half": stats.get("totalOppositionHalfPasses"),
-                "accurate_passes_opposition_half": stats.get("accurateOppositionHalfPasses"),
-                "accurate_passes_opposition_half_pct": stats.get("accurateOppositionHalfPassesPercentage")
-            }
-            
-            # Parse Defending stats
-            comp_stats["defending"] = {
-                "clean_sheets": stats.get("cleanSheets"),
-                "goals_conceded_per_game": round(stats.get("goalsConceded", 0) / matches, 2),
-                "tackles": stats.get("tackles"),
-                "interceptions": stats.get("interceptions"),
-                "saves": stats.get("saves"),
-                "clearances": stats.get("clearances"),
-                "clearances_off_line": stats.get("clearancesOffLine"),
-                "balls_recovered": stats.get("ballRecovery"),
-                "errors_leading_to_shot": stats.get("errorsLeadingToShot"),
-                "errors_leading_to_goal": stats.get("errorsLeadingToGoal"),
-                "penalties_committed": stats.get("penaltiesCommited"),
-                "last_man_tackles": stats.get("lastManTackles")
-            }
-            
-            # Parse Other stats
-            total_duels = stats.get("totalDuels")
-            duels_won = stats.get("duelsWon")
-            comp_stats["other"] = {
-                "total_duels": total_duels,
-                "duels_won": duels_won,
-                "duels_lost": (total_duels - duels_won) if total_duels is not None and duels_won is not None else None,
-                "duels_won_pct": stats.get("duelsWonPercentage"),
-                "total_aerial_duels": stats.get("totalAerialDuels"),
-                "aerial_duels_won": stats.get("aerialDuelsWon"),
-                "aerial_duels_won_pct": stats.get("aerialDuelsWonPercentage"),
-                "ground_duels_won": stats.get("groundDuelsWon"),
-                "ground_duels_won_pct": stats.get("groundDuelsWonPercentage"),
-                "yellow_cards": stats.get("yellowCards"),
-                "yellow_red_cards": stats.get("yellowRedCards"),
-                "red_cards": stats.get("redCards"),
-                "fouls": stats.get("fouls"),
-                "throw_ins": stats.get("throwIns"),
-                "goal_kicks": stats.get("goalKicks"),
-                "possession_lost": stats.get("possessionLost")
-            }
-            
-            # Filter out None values from each section (only keep fields with actual data)
-            for section in ["summary", "attacking", "passes", "defending", "other"]:
-                comp_stats[section] = {k: v for k, v in comp_stats[section].items() if v is not None}
+            comp_stats.update(parse_team_statistics(stats))
             
             print(f"  Successfully fetched {comp_name}: {comp_stats['summary']['matches']} matches")
             
         except Exception as e:
             print(f"  Error fetching {comp_name}: {e}")
-            import traceback
             traceback.print_exc()
         
         all_stats["competitions"].append(comp_stats)
     
     return all_stats
 
+# --- SofaScore League Team Statistics ---
+
+# Competition whose whole table gets a league-wide statistics file
+LEAGUE_STATISTICS_COMPETITION = SOFASCORE_COMPETITIONS[0]
+
+# Metrics where a lower value ranks higher; "matches" is not ranked at all
+LOWER_IS_BETTER = {
+    "goals_conceded", "shots_against", "goals_conceded_per_game", "big_chances_missed",
+    "errors_leading_to_shot", "errors_leading_to_goal", "penalties_committed",
+    "duels_lost", "yellow_cards", "yellow_red_cards", "red_cards", "fouls",
+    "possession_lost",
+}
+UNRANKED_METRICS = {"matches", "awarded_matches"}
+
+def fetch_league_teams(tournament_id, season_id) -> List[dict]:
+    """Teams in a Sofascore league table: id, name and current position."""
+    url = f"https://api.sofascore.com/api/v1/unique-tournament/{tournament_id}/season/{season_id}/standings/total"
+    data = fetch_json_with_playwright(url)
+    teams = []
+    for table in data.get("standings", []) if data else []:
+        for row in table.get("rows", []):
+            team = row.get("team", {})
+            if team.get("id") is not None:
+                teams.append({"team_id": team["id"], "team": team.get("name"), "position": row.get("position")})
+    return teams
+
+def rank_values(values: Dict[int, float], lower_is_better: bool = False) -> Dict[int, int]:
+    """Competition ranking (1, 2, 2, 4) of team id -> value."""
+    ordered = sorted(values.values(), reverse=not lower_is_better)
+    first_rank = {}
+    for position, value in enumerate(ordered, 1):
+        first_rank.setdefault(value, position)
+    return {team_id: first_rank[value] for team_id, value in values.items()}
+
+def fetch_league_team_statistics(competition: dict = LEAGUE_STATISTICS_COMPETITION) -> Optional[dict]:
+    """statistics/overall for every team in the league table, with per-metric ranks."""
+    tournament_id = competition["tournament_id"]
+    season_id = competition["season_id"]
+    print(f"Fetching league team statistics for {competition['name']} ({competition['season_name']})...")
+    
+    teams = fetch_league_teams(tournament_id, season_id)
+    if not teams:
+        print("  No teams found in Sofascore standings")
+        return None
+    
+    # One batch for the whole table; the fetcher keeps at most the host's
+    # concurrency limit in flight, tuples fetched earlier come from the run cache
+    responses = TEAM_STATISTICS.get_many([(t["team_id"], tournament_id, season_id) for t in teams])
+    
+    for team, data in zip(teams, responses):
+        team["statistics"] = parse_team_statistics(data.get("statistics", {})) if data else {}
+        team["ranks"] = {}
+    
+    by_id = {t["team_id"]: t for t in teams}
+    for section in STATISTICS_SECTIONS:
+        metrics = {metric for team in teams for metric in team["statistics"].get(section, {})}
+        for metric in sorted(metrics - UNRANKED_METRICS):
+            values = {t["team_id"]: t["statistics"][section][metric]
+                      for t in teams if t["statistics"].get(section, {}).get(metric) is not None}
+            for team_id, rank in rank_values(values, metric in LOWER_IS_BETTER).items():
+                by_id[team_id]["ranks"].setdefault(section, {})[metric] = rank
+    
+    fetched = sum(1 for t in teams if t["statistics"])
+    print(f"  Statistics for {fetched}/{len(teams)} teams")
+    return {
+        "scraped_at": datetime.now().isoformat(),
+        "name": competition["name"],
+        "tournament_id": tournament_id,
+        "season": competition["season_name"],
+        "season_id": season_id,
+        "teams": teams
+    }
+
 # --- SofaScore Fixtures ---
 
+class EventStore:
+    """Sofascore team events downloaded during this run.
+
+    Filled once by the fixtures fetch; events are keyed by event id and indexed
+    by opponent team id so later steps (next match, H2H) can answer from memory
+    instead of walking `events/last` again. Pages fetched before the fixtures
+    (the next match's `events/next/0`) are kept in `prefetched`, keyed by
+    (direction, page), so the paginator does not request them again.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.events = {}
+        self.by_opponent = defaultdict(list)
+        self.pages = {"last": [], "next": []}
+        self.exhausted = {"last": False, "next": False}
+        self.prefetched = {}
+
+    def add_pages(self, direction: str, pages: List[list], exhausted: bool = False):
+        """Store raw event pages for one direction, in page order."""
+        team_id = int(SOFASCORE_TEAM_ID)
+        for events in pages:
+            self.pages[direction].append(events)
+            for ev in events:
+                ev_id = ev.get("id")
+                if ev_id in self.events:
+                    continue
+                self.events[ev_id] = ev
+                home_id = ev.get("homeTeam", {}).get("id")
+                away_id = ev.get("awayTeam", {}).get("id")
+                opponent_id = away_id if home_id == team_id else home_id
+                self.by_opponent[opponent_id].append(ev_id)
+        self.exhausted[direction] = self.exhausted[direction] or exhausted
+
+    def finished_vs(self, opponent_id, limit: int = 5) -> List[dict]:
+        """Most recent finished events against an opponent, newest first."""
+        events = [self.events[ev_id] for ev_id in self.by_opponent.get(opponent_id, [])]
+        events = [ev for ev in events if ev.get("status", {}).get("type", "") == "finished"]
+        events.sort(key=lambda ev: ev.get("startTimestamp", 0), reverse=True)
+        return events[:limit]
+
+
+EVENT_STORE = EventStore()
+
+# Max Sofascore event pages requested at the same time by the paginator
+SOFASCORE_PAGE_CONCURRENCY = 6
+
+# Highest page index fetched per direction (safety limits)
+SOFASCORE_PAGE_LIMITS = {"last": 10, "next": 5}
+
+def fetch_team_event_pages(season_start_ts: int, concurrency: int = SOFASCORE_PAGE_CONCURRENCY,
+                           prefetched: Optional[dict] = None):
+    """Fetch Persib's `events/last` and `events/next` pages concurrently.
+
+    Pages are requested in waves of up to `concurrency` URLs, shared between both
+    directions, so later pages are fetched speculatively before earlier ones are
+    inspected. A direction stops at its first empty or failed page, at the `last`
+    page that reaches back past `season_start_ts`, or at its page limit; anything
+    fetched beyond a stop point is discarded. Pages found in `prefetched` (keyed by
+    (direction, page)) are used as is. Returns the event lists of each direction
+    in page order, and per direction whether its history ran out.
+    """
+    prefetched = prefetched or {}
+    pages = {"last": [], "next": []}
+    next_page = {"last": 0, "next": 0}
+    done = {"last": False, "next": False}
+    exhausted = {"last": False, "next": False}
+    
+    while not all(done.values()):
+        # Hand out the wave's slots round-robin between the open directions
+        wave = []
+        while len(wave) < concurrency:
+            added = False
+            for direction in ("last", "next"):
+                if done[direction] or next_page[direction] > SOFASCORE_PAGE_LIMITS[direction]:
+                    continue
+                if len(wave) < concurrency:
+                    wave.append((direction, next_page[direction]))
+                    next_page[direction] += 1
+                    added = True
+            if not added:
+                break
+        if not wave:
+            break
+        
+        urls = [f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/{d}/{pg}"
+                for d, pg in wave if (d, pg) not in prefetched]
+        fetched = iter(fetch_json_batch(urls))
+        results = [prefetched[key] if key in prefetched else next(fetched) for key in wave]
+        
+        # Wave entries are already in page order within each direction
+        for (direction, pg), data in zip(wave, results):
+            if done[direction]:
+                continue
+            if not data:
+                print(f"  Failed to fetch {direction} events page {pg} (Empty Data)")
+                done[direction] = True
+                continue
+            
+            events = data.get("events", [])
+            if not events:
+                done[direction] = True
+                exhausted[direction] = True
+                continue
+            pages[direction].append(events)
+            
+            # If the oldest event on this page is before season start, stop paginating
+            if direction == "last" and min(ev.get("startTimestamp", 0) for ev in events) < season_start_ts:
+                done[direction] = True
+            elif data.get("hasNextPage") is False:
+                done[direction] = True
+                exhausted[direction] = True
+        
+        for direction in ("last", "next"):
+            if next_page[direction] > SOFASCORE_PAGE_LIMITS[direction]:
+                done[direction] = True
+    
+    return pages, exhausted
+
 def fetch_fixtures_sofascore() -> dict:
     """Fetch all Persib fixtures (past and upcoming) from SofaScore API."""
     from datetime import timezone, timedelta
-    import traceback
     
     print("\nFetching fixtures from SofaScore API...")
     
@@ -803,74 +1999,36 @@ def fetch_fixtures_sofascore() -> dict:
     # Current season start (Aug 2025) as a filter
     season_start_ts = int(datetime(2025, 7, 1, tzinfo=timezone(timedelta(hours=7))).timestamp())
     
-    # Step 1: Fetch PAST events (paginated)
-    page = 0
-    while True:
-        try:
-            url = f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/last/{page}"
-            data = fetch_json_with_playwright(url)
-            
-            if not data:
-                print(f"  Failed to fetch past events page {page} (Empty Data)")
-                break
-            
-            events = data.get("events", [])
-            if not events:
-                break
-            
-            # Filter events that are in current season (after July 2025)
-            for ev in events:
-                ev_id = ev.get("id")
-                start_ts = ev.get("startTimestamp", 0)
-                if ev_id in seen_ids:
-                    continue
-                if start_ts < season_start_ts:
-                    continue
-                seen_ids.add(ev_id)
-                all_events.append(ev)
-            
-            # If the oldest event on this page is before season start, stop paginating
-            oldest_ts = min(ev.get("startTimestamp", 0) for ev in events)
-            if oldest_ts < season_start_ts:
-                break
-            
-            page += 1
-            if page > 10:  # Safety limit
-                break
-        except Exception as e:
-            print(f"  Error fetching past events page {page}: {e}")
-            break
+    # Step 1: Fetch PAST and NEXT/upcoming events (paginated, concurrently)
+    event_pages, exhausted = fetch_team_event_pages(season_start_ts, prefetched=EVENT_STORE.prefetched)
+    
+    # Keep every downloaded page (pre-season events included) for the H2H lookup
+    EVENT_STORE.clear()
+    for direction in ("last", "next"):
+        EVENT_STORE.add_pages(direction, event_pages[direction], exhausted[direction])
+    
+    # Filter events that are in current season (after July 2025).
+    # Pages are walked in order, so dedup keeps the same event as a sequential walk.
+    for events in event_pages["last"]:
+        for ev in events:
+            ev_id = ev.get("id")
+            start_ts = ev.get("startTimestamp", 0)
+            if ev_id in seen_ids:
+                continue
+            if start_ts < season_start_ts:
+                continue
+            seen_ids.add(ev_id)
+            all_events.append(ev)
     
     print(f"  Fetched {len(all_events)} past events")
     
-    # Step 2: Fetch NEXT/upcoming events (paginated)
-    page = 0
-    while True:
-        try:
-            url = f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/next/{page}"
-            data = fetch_json_with_playwright(url)
-            
-            if not data:
-                print(f"  Failed to fetch next events page {page} (Empty Data)")
-                break
-            
-            events = data.get("events", [])
-            if not events:
-                break
-            
-            for ev in events:
-                ev_id = ev.get("id")
-                if ev_id in seen_ids:
-                    continue
-                seen_ids.add(ev_id)
-                all_events.append(ev)
-            
-            page += 1
-            if page > 5:  # Safety limit
-                break
-        except Exception as e:
-            print(f"  Error fetching next events page {page}: {e}")
-            break
+    for events in event_pages["next"]:
+        for ev in events:
+            ev_id = ev.get("id")
+            if ev_id in seen_ids:
+                continue
+            seen_ids.add(ev_id)
+            all_events.append(ev)
     
     print(f"  Total events: {len(all_events)}")
     
@@ -958,7 +2116,8 @@ def fetch_next_match_sofascore() -> dict:
     next_match_data = None
     
     try:
-        # Step 1: Get next match event
+        # Step 1: Get next match event. This runs before the fixtures pagination,
+        # which reuses the page instead of requesting it again.
         next_url = f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/next/0"
         data = fetch_json_with_playwright(next_url)
         
@@ -966,6 +2125,7 @@ def fetch_next_match_sofascore() -> dict:
             print(f"  Failed to fetch SofaScore next match (Empty Data)")
             return None
         
+        EVENT_STORE.prefetched[("next", 0)] = data
         events = data.get("events", [])
         if not events:
             print("  No upcoming events found from SofaScore")
@@ -995,6 +2155,7 @@ def fetch_next_match_sofascore() -> dict:
             "away_team": away_team.get("name", "Unknown"),
             "date": date_str,
             "time": time_str,
+            "start_timestamp": start_ts,
             "league": unique_tournament.get("name", tournament.get("name", "Unknown")),
             "round": round_info.get("round"),
             "stats": [],
@@ -1004,11 +2165,13 @@ def fetch_next_match_sofascore() -> dict:
         
         print(f"  Next match: {next_match_data['home_team']} vs {next_match_data['away_team']} ({date_str} {time_str})")
         
-        # Step 2: Fetch pregame form (positions, points, form)
+        # Pregame form and H2H summary are requested together
+        form_url = f"https://api.sofascore.com/api/v1/event/{event_id}/pregame-form"
+        h2h_url = f"https://api.sofascore.com/api/v1/event/{event_id}/h2h"
+        form_data, h2h_data = fetch_json_batch([form_url, h2h_url])
+        
+        # Step 2: Pregame form (positions, points, form)
         try:
-            form_url = f"https://api.sofascore.com/api/v1/event/{event_id}/pregame-form"
-            form_data = fetch_json_with_playwright(form_url)
-            
             if form_data:
                 home_form = form_data.get("homeTeam", {})
                 away_form = form_data.get("awayTeam", {})
@@ -1049,11 +2212,13 @@ def fetch_next_match_sofascore() -> dict:
         season_id = season.get("id")
         
         if tournament_id and season_id:
-            for team_key, team_id in [("home", home_team_id), ("away", away_team_id)]:
+            # Both teams in one batch, memoized for the team statistics step
+            stats_roots = TEAM_STATISTICS.get_many([
+                (home_team_id, tournament_id, season_id),
+                (away_team_id, tournament_id, season_id),
+            ])
+            for team_key, stats_data_root in zip(("home", "away"), stats_roots):
                 try:
-                    stats_url = f"https://api.sofascore.com/api/v1/team/{team_id}/unique-tournament/{tournament_id}/season/{season_id}/statistics/overall"
-                    stats_data_root = fetch_json_with_playwright(stats_url)
-                    
                     if stats_data_root:
                         stats_data = stats_data_root.get("statistics", {})
                         goals_scored = stats_data.get("goalsScored", 0)
@@ -1076,13 +2241,11 @@ def fetch_next_match_sofascore() -> dict:
                             next_match_data["stats"].append(gcpg_stat)
                         gcpg_stat[team_key] = f"{gcpg:.2f}"
                 except Exception as e:
-                    print(f"  Error fetching team stats for {team_key}: {e}")
+                    print(f"  Error reading team stats for {team_key}: {e}")
         
-        # Step 4: Fetch H2H data (summary + match history)
+        # Step 4: H2H summary; the match history is added by fetch_next_match_history
+        # once the fixtures fetch has stored Persib's past events
         try:
-            h2h_url = f"https://api.sofascore.com/api/v1/event/{event_id}/h2h"
-            h2h_data = fetch_json_with_playwright(h2h_url)
-            
             home_team_logo = f"https://api.sofascore.com/api/v1/team/{home_team_id}/image" if home_team_id else None
             away_team_logo = f"https://api.sofascore.com/api/v1/team/{away_team_id}/image" if away_team_id else None
             
@@ -1090,53 +2253,6 @@ def fetch_next_match_sofascore() -> dict:
             if h2h_data:
                 team_duel = h2h_data.get("teamDuel", {})
             
-            # Fetch H2H match history by scanning Persib's past events for opponent matches
-            opponent_id = away_team_id if home_team_id == int(SOFASCORE_TEAM_ID) else home_team_id
-            h2h_matches = []
-            
-            for pg in range(10):  # Scan up to 10 pages of past events
-                try:
-                    past_url = f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/last/{pg}"
-                    past_data = fetch_json_with_playwright(past_url)
-                    
-                    if not past_data:
-                        break
-                    past_events = past_data.get("events", [])
-                    if not past_events:
-                        break
-                    
-                    for ev in past_events:
-                        ev_home_id = ev.get("homeTeam", {}).get("id")
-                        ev_away_id = ev.get("awayTeam", {}).get("id")
-                        ev_status = ev.get("status", {}).get("type", "")
-                        
-                        if ev_status != "finished":
-                            continue
-                        if opponent_id not in (ev_home_id, ev_away_id):
-                            continue
-                        
-                        ev_ts = ev.get("startTimestamp", 0)
-                        ev_dt = datetime.fromtimestamp(ev_ts, tz=timezone(timedelta(hours=7)))
-                        ev_hs = ev.get("homeScore", {}).get("current", 0)
-                        ev_as = ev.get("awayScore", {}).get("current", 0)
-                        
-                        h2h_matches.append({
-                            "_ts": ev_ts,
-                            "date": ev_dt.strftime("%b %d, %Y"),
-                            "home_team": ev.get("homeTeam", {}).get("name", "Unknown"),
-                            "away_team": ev.get("awayTeam", {}).get("name", "Unknown"),
-                            "score": f"{ev_hs} - {ev_as}"
-                        })
-                except Exception:
-                    break
-            
-            # Sort by date descending (most recent first) and take top 5
-            h2h_matches.sort(key=lambda x: x["_ts"], reverse=True)
-            h2h_matches = h2h_matches[:5]
-            # Remove internal timestamp
-            for m in h2h_matches:
-                del m["_ts"]
-            
             next_match_data["head_to_head"] = {
                 "summary": {
                     "team1_name": home_team.get("name", "Unknown"),
@@ -1147,12 +2263,10 @@ def fetch_next_match_sofascore() -> dict:
                     "draws": team_duel.get("draws", 0),
                     "team2_wins": team_duel.get("awayWins", 0)
                 },
-                "matches": h2h_matches
+                "matches": []
             }
             
-            print(f"  H2H: {team_duel.get('homeWins', 0)}W - {team_duel.get('draws', 0)}D - {team_duel.get('awayWins', 0)}L ({len(h2h_matches)} matches)")
-            for m in h2h_matches:
-                print(f"    {m['date']}: {m['home_team']} {m['score']} {m['away_team']}")
+            print(f"  H2H: {team_duel.get('homeWins', 0)}W - {team_duel.get('draws', 0)}D - {team_duel.get('awayWins', 0)}L")
         except Exception as e:
             print(f"  Error fetching H2H: {e}")
         
@@ -1162,23 +2276,139 @@ def fetch_next_match_sofascore() -> dict:
     
     return next_match_data
 
+def fetch_next_match_history(next_match_data: dict):
+    """Add the H2H match history to the next match, from the run's event store.
+
+    Called after the fixtures fetch: Persib's past events against the opponent
+    are answered from the stored pages. Older pages (up to 10 in total) are only
+    fetched when the stored history is too short.
+    """
+    from datetime import timezone, timedelta
+    
+    head_to_head = next_match_data.get("head_to_head")
+    next_pages = EVENT_STORE.pages["next"]
+    if head_to_head is None or not next_pages or not next_pages[0]:
+        return
+    
+    try:
+        event = next_pages[0][0]
+        home_team_id = event.get("homeTeam", {}).get("id")
+        away_team_id = event.get("awayTeam", {}).get("id")
+        opponent_id = away_team_id if home_team_id == int(SOFASCORE_TEAM_ID) else home_team_id
+        
+        stored_pages = len(EVENT_STORE.pages["last"])
+        if len(EVENT_STORE.finished_vs(opponent_id)) < 5 and not EVENT_STORE.exhausted["last"] and stored_pages < 10:
+            past_urls = [
+                f"https://api.sofascore.com/api/v1/team/{SOFASCORE_TEAM_ID}/events/last/{pg}"
+                for pg in range(stored_pages, 10)
+            ]
+            older_pages = []
+            for past_data in fetch_json_batch(past_urls):
+                past_events = past_data.get("events", []) if past_data else []
+                if not past_events:
+                    break
+                older_pages.append(past_events)
+            EVENT_STORE.add_pages("last", older_pages, exhausted=len(older_pages) < len(past_urls))
+        
+        # Already sorted by date descending (most recent first), top 5
+        h2h_matches = []
+        for ev in EVENT_STORE.finished_vs(opponent_id):
+            ev_ts = ev.get("startTimestamp", 0)
+            ev_dt = datetime.fromtimestamp(ev_ts, tz=timezone(timedelta(hours=7)))
+            ev_hs = ev.get("homeScore", {}).get("current", 0)
+            ev_as = ev.get("awayScore", {}).get("current", 0)
+            
+            h2h_matches.append({
+                "date": ev_dt.strftime("%b %d, %Y"),
+                "home_team": ev.get("homeTeam", {}).get("name", "Unknown"),
+                "away_team": ev.get("awayTeam", {}).get("name", "Unknown"),
+                "score": f"{ev_hs} - {ev_as}"
+            })
+        head_to_head["matches"] = h2h_matches
+        
+        print(f"  H2H history: {len(h2h_matches)} matches")
+        for m in h2h_matches:
+            print(f"    {m['date']}: {m['home_team']} {m['score']} {m['away_team']}")
+    except Exception as e:
+        print(f"  Error fetching H2H history: {e}")
+
 # --- Main Logic ---
 
-def main():
-    # 1. Fetch Team API directly (for standings)
+TEAM_API_URL = f"https://www.fotmob.com/api/teams?id={TEAM_ID}"
+
+# Also write standings_team_<id>.json for every team found in the standings.
+# Enable with SCRAPER_TEAM_STANDINGS=1.
+WRITE_TEAM_STANDINGS = os.environ.get("SCRAPER_TEAM_STANDINGS", "") == "1"
+
+# Also write league_team_statistics.json (every team in LEAGUE_STATISTICS_COMPETITION).
+# Off by default: about one extra Sofascore request per league team on every run.
+# Enable with SCRAPER_LEAGUE_STATISTICS=1.
+WRITE_LEAGUE_TEAM_STATISTICS = os.environ.get("SCRAPER_LEAGUE_STATISTICS", "") == "1"
+
+def fetch_team_api() -> dict:
+    """Fetch the FotMob Team API (source of all standings tables)."""
     print("Fetching Team API data...")
-    team_api_url = f"https://www.fotmob.com/api/teams?id={TEAM_ID}"
-    team_api_data = {}
     try:
-        resp = requests.get(team_api_url, headers=HEADERS, timeout=30)
+        resp = http_get(TEAM_API_URL)
         if resp.status_code == 200:
-            team_api_data = resp.json()
-        else:
-            print(f"  Failed to fetch Team API: {resp.status_code}")
+            with REPORT.timer("json_parse"):
+                return resp.json()
+        print(f"  Failed to fetch Team API: {resp.status_code}")
     except Exception as e:
         print(f"  Error fetching Team API: {e}")
+    return {}
+
+def fetch_top_stat(stat_key: str, api_url: str) -> Optional[requests.Response]:
+    """Fetch one data.fotmob.com stats file, unparsed (None on failure)."""
+    print(f"Fetching API stats: {stat_key}...")
+    try:
+        resp = http_get(api_url)
+        if resp.status_code == 200:
+            return resp
+        print(f"  Failed to fetch {stat_key}: {resp.status_code}")
+    except Exception as e:
+        print(f"  Error fetching {stat_key}: {e}")
+    return None
 
-    # 2. Fetch Player JSON Stats
+def parse_top_stat(stat_key: str, resp: Optional[requests.Response]) -> Optional[List[Dict]]:
+    """Persib's players from a fetched stats file (None if the fetch or parse failed)."""
+    if resp is None:
+        return None
+    try:
+        with REPORT.timer("json_parse"):
+            data = resp.json()
+        return parse_top_stats_from_json(data, stat_key)
+    except Exception as e:
+        print(f"  Error parsing {stat_key}: {e}")
+    return None
+
+def outputs_exist(*filenames: str) -> bool:
+    return all((SCRIPT_DIR / name).exists() for name in filenames)
+
+def run_fotmob_standings():
+    """FotMob phase: Team API -> standings_*.json and persib_standings.json."""
+    team_api_data = fetch_team_api()
+    
+    outputs = ["standings_all.json", "standings_home.json", "standings_away.json", "persib_standings.json"]
+    if HTTP_CACHE.is_unchanged(TEAM_API_URL) and outputs_exist(*outputs):
+        print("Team API unchanged, keeping existing standings files")
+        return
+    
+    # Standings (from API), all views in one pass
+    if team_api_data:
+        print("\nParsing standings to JSON...")
+        standings = parse_standings_views_from_api(team_api_data)
+        for t_type in STANDINGS_VIEWS:
+            save_to_json(standings[t_type], f"standings_{t_type}.json")
+        save_to_json(standings["persib"], "persib_standings.json")
+        
+        if WRITE_TEAM_STANDINGS:
+            index = standings["index"]
+            for team_id in index.team_ids():
+                save_to_json(index.extract(team_id), team_standings_filename(team_id))
+
+def run_fotmob_top_stats():
+    """FotMob phase: player stat files -> top_stats.json."""
     api_stats_tasks = {
         "goals": f"https://data.fotmob.com/stats/{LEAGUE_ID}/season/{SEASON_ID}/goals.json",
         "assists": f"https://data.fotmob.com/stats/{LEAGUE_ID}/season/{SEASON_ID}/goal_assist.json",
@@ -1187,48 +2417,125 @@ def main():
         "red_cards": f"https://data.fotmob.com/stats/{LEAGUE_ID}/season/{SEASON_ID}/red_card.json",
     }
     
-    # 3. Parsing
-    print("\nParsing data to JSON...")
-    
-    # Standings (from API)
-    if team_api_data:
-        for t_type in ["all", "home", "away"]:
-            s_data = parse_standings_from_api(team_api_data, t_type)
-            save_to_json(s_data, f"standings_{t_type}.json")
-            if t_type == "all":
-                save_to_json(extract_persib_standings(s_data), "persib_standings.json")
-    
-    # Fixtures (from SofaScore API)
-    fixtures_data = fetch_fixtures_sofascore()
-    
-    # Next match data with pregame stats & H2H (from SofaScore API)
-    sofascore_next = fetch_next_match_sofascore()
-    if sofascore_next:
-        fixtures_data["next_match"] = sofascore_next
+    # Players Stats (API), fetched in parallel within the data.fotmob.com limit
+    with ThreadPoolExecutor(max_workers=len(api_stats_tasks)) as executor:
+        responses = list(executor.map(lambda item: fetch_top_stat(*item), api_stats_tasks.items()))
     
-    save_to_json(fixtures_data, "fixtures.json")
+    # Every file answered 304: nothing to parse
+    if HTTP_CACHE.is_unchanged(*api_stats_tasks.values()) and outputs_exist("top_stats.json"):
+        print("Player stats unchanged, keeping existing top_stats.json")
+        return
     
-    # Players Stats (API)
     top = {"scraped_at": datetime.now().isoformat(), "team": "Persib Bandung", "stats": {}}
-    for stat_key, api_url in api_stats_tasks.items():
-        print(f"Fetching API stats: {stat_key}...")
-        try:
-            resp = requests.get(api_url, headers=HEADERS, timeout=30)
-            if resp.status_code == 200:
-                top["stats"][stat_key] = parse_top_stats_from_json(resp.json(), stat_key)
-            else:
-                print(f"  Failed to fetch {stat_key}: {resp.status_code}")
-                top["stats"][stat_key] = []
-        except Exception as e:
-            print(f"  Error fetching {stat_key}: {e}")
-            top["stats"][stat_key] = []
+    for stat_key, resp in zip(api_stats_tasks, responses):
+        # None = fetch failed: serve the last good list instead of an empty one
+        stat_list = serve_last_good(
+            top, "top_stats.json", f"top_stats_{stat_key}", parse_top_stat(stat_key, resp),
+            lambda v: v is not None, lambda previous, k=stat_key: previous["stats"][k]
+        )
+        top["stats"][stat_key] = stat_list if stat_list is not None else []
             
     save_to_json(top, "top_stats.json")
+
+def next_match_kickoff(next_match: dict) -> float:
+    """Kickoff of a next_match entry as unix time (Sofascore's startTimestamp).
+
+    Entries written before start_timestamp was stored count as expired: without
+    it there is no way to tell whether the match has already been played.
+    """
+    try:
+        return float(next_match["start_timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+def run_sofascore():
+    """Sofascore phase: next match + fixtures, then team statistics.
+
+    Runs entirely on one thread because the shared Playwright browser is bound
+    to the thread that launched it, so requests go out in the order below.
+    """
+    try:
+        # Next match data with pregame stats & H2H summary (from SofaScore API),
+        # before the long tail of fixtures pages
+        sofascore_next = fetch_next_match_sofascore()
+        
+        # Fixtures (from SofaScore API); a failed fetch serves the last good list
+        fixtures_data = fetch_fixtures_sofascore()
+        fixtures_data["fixtures"] = serve_last_good(
+            fixtures_data, "fixtures.json", "fixtures", fixtures_data["fixtures"],
+            bool, lambda previous: previous["fixtures"]
+        )
+        
+        # H2H match history, answered from the fixtures' event pages
+        if sofascore_next:
+            fetch_next_match_history(sofascore_next)
+        fixtures_data["next_match"] = serve_last_good(
+            fixtures_data, "fixtures.json", "next_match", sofascore_next,
+            bool, lambda previous: previous["next_match"], expires_at=next_match_kickoff
+        )
+        
+        save_to_json(fixtures_data, "fixtures.json")
+        
+        # Sofascore Team Statistics
+        print("\nFetching Sofascore team statistics...")
+        sofascore_stats = fetch_sofascore_team_statistics()
+        competitions = sofascore_stats["competitions"]
+        for i, comp in enumerate(competitions):
+            tournament_id = str(comp["tournament_id"])
+            competitions[i] = serve_last_good(
+                sofascore_stats, "team_statistics.json", f"team_statistics_{tournament_id}", comp,
+                lambda c: bool(c.get("summary")),
+                lambda previous, t=tournament_id: next(
+                    c for c in previous["competitions"] if str(c["tournament_id"]) == t
+                )
+            )
+        save_to_json(sofascore_stats, "team_statistics.json")
+        
+        # League-wide team statistics, after Persib's own so a throttled sweep
+        # cannot affect team_statistics.json (Persib's entry comes from the run cache)
+        if WRITE_LEAGUE_TEAM_STATISTICS:
+            print("\nFetching Sofascore league team statistics...")
+            league_stats = fetch_league_team_statistics()
+            if league_stats:
+                save_to_json(league_stats, "league_team_statistics.json")
+    finally:
+        # Release the shared Sofascore browser and run-scoped caches
+        BROWSER_POOL.close()
+        EVENT_STORE.clear()
+        TEAM_STATISTICS.clear()
+
+def run_stage(name: str, phase):
+    with REPORT.stage(name):
+        phase()
+
+def main():
+    # FotMob and Sofascore are independent sources: run their phases side by
+    # side and let each one write its files as soon as its data is ready.
+    phases = {
+        "FotMob standings": run_fotmob_standings,
+        "FotMob top stats": run_fotmob_top_stats,
+        "Sofascore": run_sofascore,
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        futures = {executor.submit(run_stage, name, phase): name for name, phase in phases.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                print(f"Phase done: {futures[future]}")
+            except Exception as e:
+                print(f"Phase failed: {futures[future]}: {e}")
+                traceback.print_exc()
+    
+    if CHANGED_FILES:
+        print(f"\nChanged files: {', '.join(sorted(CHANGED_FILES))}")
+    else:
+        print("\nNo output files changed")
+    
+    for host, stats in sorted(SCHEDULER.summary().items()):
+        print(f"  {host}: {stats['requests']} requests, {stats['throttled']} throttled, final rate {stats['rate']} req/s")
     
-    # 5. Fetch Sofascore Team Statistics
-    print("\nFetching Sofascore team statistics...")
-    sofascore_stats = fetch_sofascore_team_statistics()
-    save_to_json(sofascore_stats, "team_statistics.json")
+    REPORT.write()
 
 if __name__ == "__main__":
     main()
@@ -3,14 +3,53 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from html.parser import HTMLParser
+import argparse
+import multiprocessing
+import os
+import threading
+from array import array
 import time
+import copy
 import json
 import re
+import numpy as np
 from datetime import datetime
+from urllib.parse import urlparse
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 
-def fetch_full_html(url):
+def oldest_loaded_round(driver):
+    """Nomor pekan dari header event__round paling bawah (hasil terlama yang sudah dimuat)."""
+    texts = driver.execute_script(
+        "return Array.from(document.querySelectorAll('.event__round'), el => el.textContent.trim());"
+    )
+    rounds = [round_number(text) for text in texts if text.startswith("Round")]
+    return rounds[-1] if rounds else None
+
+# Batas waktu (detik) menunggu halaman awal, tombol "show more", dan baris baru
+INITIAL_LOAD_TIMEOUT = 20
+SHOW_MORE_TIMEOUT = 10
+ROWS_TIMEOUT = 15
+
+# Berapa kali menunggu tombol "show more" yang ada tapi belum bisa diklik
+SHOW_MORE_ATTEMPTS = 3
+SHOW_MORE_SELECTOR = "a.wclButtonLink"
+
+def count_match_rows(driver):
+    return driver.execute_script("return document.querySelectorAll('.event__match').length;")
+
+def wait_for_more_rows(driver, before, timeout):
+    """Tunggu sampai jumlah baris event__match melebihi `before`; kembalikan jumlah baru."""
+    def more_rows(d):
+        rows = count_match_rows(d)
+        return rows if rows > before else False
+    
+    return WebDriverWait(driver, timeout, poll_frequency=0.1).until(more_rows)
+
+def create_driver():
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
@@ -18,190 +57,721 @@ def fetch_full_html(url):
     options.add_argument("--disable-gpu")
     options.add_argument("--disable-software-rasterizer")
     options.add_argument("--window-size=1920,1080")
-    driver = webdriver.Chrome(options=options)
+    return webdriver.Chrome(options=options)
+
+class DriverPool:
+    """
+    Pool Chrome driver terbatas untuk mode batch. Driver dibuat saat
+    dibutuhkan (maksimal `size`) dan dipakai ulang antar liga; satu driver
+    hanya dipakai satu thread dalam satu waktu.
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle = []
+        self.all = []
+        self.lock = threading.Lock()
+    
+    @contextmanager
+    def driver(self):
+        with self.slots:
+            with self.lock:
+                driver = self.idle.pop() if self.idle else None
+            if driver is None:
+                driver = create_driver()
+                with self.lock:
+                    self.all.append(driver)
+            broken = False
+            try:
+                yield driver
+            except WebDriverException:
+                broken = True
+                raise
+            finally:
+                with self.lock:
+                    if broken:
+                        self.all.remove(driver)
+                    else:
+                        self.idle.append(driver)
+                if broken:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
     
-    print("Mengakses halaman dan memuat semua pertandingan...")
+    def close(self):
+        with self.lock:
+            drivers, self.all, self.idle = self.all, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+def fetch_full_html(url, stop_before_round=None, driver=None):
+    """
+    Muat halaman hasil dan klik "show more" sampai habis. Jika
+    `stop_before_round` diisi (mode inkremental), berhenti begitu pekan
+    yang lebih lama dari itu sudah tampil: semua pekan >= stop_before_round
+    sudah termuat lengkap. Tanpa `driver`, driver baru dibuat lalu ditutup.
+    """
+    own_driver = driver is None
+    if own_driver:
+        driver = create_driver()
+    try:
+        return _load_all_results(driver, url, stop_before_round)
+    finally:
+        if own_driver:
+            driver.quit()
+
+def wait_for_show_more(driver):
+    """
+    Tombol "show more" yang bisa diklik, atau None jika semua hasil sudah
+    dimuat. Hanya tombol yang tidak ada lagi berarti hasil habis; tombol yang
+    masih ada tapi belum bisa diklik (halaman lambat) ditunggu lagi.
+    """
+    for attempt in range(1, SHOW_MORE_ATTEMPTS + 1):
+        try:
+            return WebDriverWait(driver, SHOW_MORE_TIMEOUT).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, SHOW_MORE_SELECTOR))
+            )
+        except TimeoutException:
+            if not driver.find_elements(By.CSS_SELECTOR, SHOW_MORE_SELECTOR):
+                print("Semua pertandingan telah dimuat.")
+                return None
+            print(f"Tombol show more belum bisa diklik (percobaan {attempt}/{SHOW_MORE_ATTEMPTS})...")
+    print("PERINGATAN: tombol show more tidak pernah bisa diklik, hasil mungkin tidak lengkap.")
+    return None
+
+def _load_all_results(driver, url, stop_before_round):
+    print(f"Mengakses {url} dan memuat semua pertandingan...")
+    start = time.perf_counter()
     driver.get(url)
+    try:
+        rows = wait_for_more_rows(driver, 0, INITIAL_LOAD_TIMEOUT)
+    except TimeoutException:
+        rows = count_match_rows(driver)
+    print(f"  Halaman awal: {rows} pertandingan ({time.perf_counter() - start:.2f} detik)")
     
+    load_times = []
     while True:
+        if stop_before_round is not None:
+            oldest = oldest_loaded_round(driver)
+            if oldest is not None and oldest < stop_before_round:
+                print(f"Pekan {stop_before_round} ke atas sudah dimuat, berhenti memuat.")
+                break
+        show_more = wait_for_show_more(driver)
+        if show_more is None:
+            break
+        
+        # Tunggu baris baru muncul di DOM, bukan sleep tetap
+        before = rows
+        start = time.perf_counter()
         try:
-            show_more = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.wclButtonLink"))
-            )
             driver.execute_script("arguments[0].click();", show_more)
-            time.sleep(2)
-        except Exception:
-            print("Semua pertandingan telah dimuat.")
+            rows = wait_for_more_rows(driver, before, ROWS_TIMEOUT)
+        except (TimeoutException, WebDriverException):
+            print("Tidak ada pertandingan baru setelah klik, berhenti memuat.")
             break
+        load_times.append(time.perf_counter() - start)
+        print(f"  Muat #{len(load_times)}: +{rows - before} pertandingan ({load_times[-1]:.2f} detik)")
     
-    html = driver.page_source
-    driver.quit()
-    return html
+    if load_times:
+        print(f"Total {len(load_times)} kali muat dalam {sum(load_times):.2f} detik "
+              f"(rata-rata {sum(load_times) / len(load_times):.2f} detik)")
+    
+    return driver.page_source
+
+RED_CARD_ICON = 'wcl-icon-incidents-red-card'
+YELLOW_CARD_ICON = 'wcl-icon-incidents-yellow-card'
+
+class MatchRowExtractor(HTMLParser):
+    """
+    Ekstraktor streaming (event-driven) untuk halaman hasil Flashscore.
+    Tidak membangun pohon soup: hanya melacak header event__round dan
+    baris event__match yang sedang terbuka, lalu mengeluarkan record
+    pertandingan begitu div barisnya ditutup.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.matches = MatchStore()
+        self.current_round = None
+        self.depth = 0            # kedalaman div saat ini
+        self.round_depth = None   # kedalaman div event__round yang terbuka
+        self.round_text = []
+        self.row = None           # state baris event__match yang terbuka
+        self.capture = None       # teks elemen yang sedang dikumpulkan
+
+    def _new_row(self):
+        return {
+            'depth': self.depth,
+            'round': self.current_round,
+            'side': None, 'side_depth': None,
+            'seen': set(),        # participant div yang sudah ditemukan
+            'name': {}, 'score': {},
+            'reds': {'home': 0, 'away': 0},
+            'yellows': {'home': 0, 'away': 0},
+            'svg': None, 'svg_depth': 0,
+        }
+
+    def _start_capture(self, tag, key, target):
+        self.capture = {'tag': tag, 'depth': 1, 'key': key, 'target': target, 'parts': []}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        row = self.row
+
+        if self.capture is not None and tag == self.capture['tag']:
+            self.capture['depth'] += 1
+
+        if tag == 'div':
+            self.depth += 1
+            if row is None:
+                if self.round_depth is None and 'event__round' in classes:
+                    self.round_depth = self.depth
+                    self.round_text = []
+                elif self.round_depth is None and 'event__match' in classes:
+                    self.row = self._new_row()
+            elif row['side'] is None:
+                for side in ('home', 'away'):
+                    if f'event__{side}Participant' in classes and side not in row['seen']:
+                        row['seen'].add(side)
+                        row['side'], row['side_depth'] = side, self.depth
+            return
+
+        if row is None:
+            return
+
+        side = row['side']
+        if tag == 'span' and self.capture is None:
+            if side and 'wcl-name_jjfMf' in classes and side not in row['name']:
+                self._start_capture('span', side, row['name'])
+            else:
+                for score_side in ('home', 'away'):
+                    if f'event__score--{score_side}' in classes and score_side not in row['score']:
+                        self._start_capture('span', score_side, row['score'])
+                        break
+        elif tag == 'svg':
+            if row['svg'] is not None:
+                row['svg_depth'] += 1
+            elif side and attrs.get('data-testid') in (RED_CARD_ICON, YELLOW_CARD_ICON):
+                row['svg'] = {'icon': attrs.get('data-testid'), 'side': side, 'text': None}
+                row['svg_depth'] = 1
+        elif tag == 'text' and row['svg'] is not None and row['svg']['text'] is None and self.capture is None:
+            # Hanya elemen <text> pertama di dalam ikon kartu yang dipakai
+            row['svg']['text'] = []
+            self._start_capture('text', 'text', row['svg'])
+
+    def handle_endtag(self, tag):
+        capture = self.capture
+        if capture is not None and tag == capture['tag']:
+            capture['depth'] -= 1
+            if capture['depth'] == 0:
+                capture['target'][capture['key']] = ''.join(capture['parts'])
+                self.capture = None
+
+        row = self.row
+        if tag == 'svg' and row is not None and row['svg'] is not None:
+            row['svg_depth'] -= 1
+            if row['svg_depth'] == 0:
+                svg = row['svg']
+                counts = row['reds'] if svg['icon'] == RED_CARD_ICON else row['yellows']
+                counts[svg['side']] += int(svg['text']) if svg['text'] is not None else 1
+                row['svg'] = None
+
+        if tag != 'div':
+            return
+        if self.round_depth == self.depth:
+            text = ''.join(self.round_text)
+            if text.startswith("Round"):
+                self.current_round = text
+            self.round_depth = None
+        elif row is not None:
+            if row['side_depth'] == self.depth:
+                row['side'], row['side_depth'] = None, None
+            elif row['depth'] == self.depth:
+                self._emit(row)
+                self.row = None
+        self.depth -= 1
+
+    def handle_data(self, data):
+        text = data.strip()
+        if not text:
+            return
+        if self.capture is not None:
+            self.capture['parts'].append(text)
+        if self.round_depth is not None:
+            self.round_text.append(text)
+
+    def close(self):
+        super().close()
+        if self.row is not None:
+            self._emit(self.row)
+            self.row = None
+
+    def _emit(self, row):
+        if not row['round']:
+            return
+        if 'home' not in row['seen'] or 'away' not in row['seen']:
+            return
+        if 'home' not in row['name'] or 'away' not in row['name']:
+            return
+
+        home_team = row['name']['home']
+        away_team = row['name']['away']
+
+        # Normalisasi nama tim
+        if home_team == "Borneo FC":
+            home_team = "Borneo"
+        if away_team == "Borneo FC":
+            away_team = "Borneo"
+
+        if 'home' not in row['score'] or 'away' not in row['score']:
+            return
+
+        try:
+            home_score = int(row['score']['home'])
+            away_score = int(row['score']['away'])
+        except:
+            return
+
+        self.matches.append({
+            'round': row['round'],
+            'home': home_team,
+            'away': away_team,
+            'home_score': home_score,
+            'away_score': away_score,
+            'home_reds': row['reds']['home'],
+            'away_reds': row['reds']['away'],
+            'home_yellows': row['yellows']['home'],
+            'away_yellows': row['yellows']['away']
+        })
+
+def round_number(round_name):
+    return int(re.search(r'\d+', round_name).group())
+
+# Kolom MatchStore: (nama field record, typecode array)
+MATCH_COLUMNS = (
+    ('round', 'H'), ('home', 'H'), ('away', 'H'),
+    ('home_score', 'B'), ('away_score', 'B'),
+    ('home_reds', 'B'), ('away_reds', 'B'),
+    ('home_yellows', 'B'), ('away_yellows', 'B'),
+)
+
+class MatchStore:
+    """
+    Penyimpanan hasil pertandingan berbentuk kolom. Nama tim dan nama
+    pekan di-intern menjadi id integer; skor dan kartu disimpan di
+    array bertipe (array.array), bisa dibaca sebagai kolom NumPy tanpa
+    salinan. Record dict hanya dibuat saat diminta (to_dicts) untuk
+    output JSON.
+    """
+    
+    def __init__(self):
+        self.teams = []         # id -> nama tim (urutan kemunculan pertama)
+        self.team_ids = {}      # nama tim -> id
+        self.round_names = []   # id -> nama pekan ("Round 12")
+        self.round_ids = {}
+        self.columns = {name: array(code) for name, code in MATCH_COLUMNS}
+    
+    @classmethod
+    def from_matches(cls, matches):
+        store = cls()
+        for match in matches:
+            store.append(match)
+        return store
+    
+    def __len__(self):
+        return len(self.columns['round'])
+    
+    def _intern(self, names, ids, name):
+        i = ids.get(name)
+        if i is None:
+            i = ids[name] = len(names)
+            names.append(name)
+        return i
+    
+    def append(self, match):
+        columns = self.columns
+        columns['round'].append(self._intern(self.round_names, self.round_ids, match['round']))
+        columns['home'].append(self._intern(self.teams, self.team_ids, match['home']))
+        columns['away'].append(self._intern(self.teams, self.team_ids, match['away']))
+        for name, _ in MATCH_COLUMNS[3:]:
+            columns[name].append(match[name])
+    
+    def column(self, name):
+        """Kolom sebagai array NumPy (view, tanpa salinan)."""
+        values = self.columns[name]
+        return np.frombuffer(values, dtype=values.typecode) if len(values) else np.zeros(0, dtype=values.typecode)
+    
+    def sort_by_round(self):
+        """Urutkan in-place berdasarkan nomor pekan (stabil)."""
+        numbers = np.array([round_number(name) for name in self.round_names], dtype=np.int64)
+        order = np.argsort(numbers[self.column('round')], kind='stable') if len(self) else []
+        for name, code in MATCH_COLUMNS:
+            values = self.column(name)
+            self.columns[name] = array(code, values[order].tobytes()) if len(self) else array(code)
+    
+    def rows(self):
+        """Iterasi tuple integer per pertandingan, urutan sesuai MATCH_COLUMNS."""
+        return zip(*(self.columns[name] for name, _ in MATCH_COLUMNS))
+    
+    def to_dicts(self):
+        teams = self.teams
+        round_names = self.round_names
+        return [{
+            'round': round_names[r],
+            'home': teams[h],
+            'away': teams[a],
+            'home_score': hs,
+            'away_score': asa,
+            'home_reds': hr,
+            'away_reds': ar,
+            'home_yellows': hy,
+            'away_yellows': ay
+        } for r, h, a, hs, asa, hr, ar, hy, ay in self.rows()]
 
 def extract_matches(html):
-    soup = BeautifulSoup(html, 'html.parser')
-    matches = []
-    current_round = None
+    extractor = MatchRowExtractor()
+    extractor.feed(html)
+    extractor.close()
+    matches = extractor.matches
     
-    for element in soup.find_all('div'):
-        classes = element.get('class', [])
-        
-        if 'event__round' in classes:
-            text = element.get_text(strip=True)
-            if text.startswith("Round"):
-                current_round = text
-        
-        elif 'event__match' in classes:
-            if not current_round:
-                continue
-                
-            home_div = element.find('div', class_='event__homeParticipant')
-            away_div = element.find('div', class_='event__awayParticipant')
-            
-            if not home_div or not away_div:
-                continue
-                
-            home_name_span = home_div.find('span', class_='wcl-name_jjfMf')
-            away_name_span = away_div.find('span', class_='wcl-name_jjfMf')
-            
-            if not home_name_span or not away_name_span:
-                continue
-                
-            home_team = home_name_span.get_text(strip=True)
-            away_team = away_name_span.get_text(strip=True)
-            
-            # Normalisasi nama tim
-            if home_team == "Borneo FC":
-                home_team = "Borneo"
-            if away_team == "Borneo FC":
-                away_team = "Borneo"
-            
-            home_score_span = element.find('span', class_='event__score--home')
-            away_score_span = element.find('span', class_='event__score--away')
-            
-            if not home_score_span or not away_score_span:
-                continue
-            
-            try:
-                home_score = int(home_score_span.get_text(strip=True))
-                away_score = int(away_score_span.get_text(strip=True))
-            except:
-                continue
-            
-            # Kartu merah
-            home_reds = 0
-            away_reds = 0
-            
-            for svg in home_div.find_all('svg', {'data-testid': 'wcl-icon-incidents-red-card'}):
-                text = svg.find('text')
-                home_reds += int(text.get_text(strip=True)) if text else 1
-                
-            for svg in away_div.find_all('svg', {'data-testid': 'wcl-icon-incidents-red-card'}):
-                text = svg.find('text')
-                away_reds += int(text.get_text(strip=True)) if text else 1
-            
-            # Kartu kuning
-            home_yellows = 0
-            away_yellows = 0
-            
-            for svg in home_div.find_all('svg', {'data-testid': 'wcl-icon-incidents-yellow-card'}):
-                text = svg.find('text')
-                home_yellows += int(text.get_text(strip=True)) if text else 1
-                
-            for svg in away_div.find_all('svg', {'data-testid': 'wcl-icon-incidents-yellow-card'}):
-                text = svg.find('text')
-                away_yellows += int(text.get_text(strip=True)) if text else 1
-            
-            matches.append({
-                'round': current_round,
-                'home': home_team,
-                'away': away_team,
-                'home_score': home_score,
-                'away_score': away_score,
-                'home_reds': home_reds,
-                'away_reds': away_reds,
-                'home_yellows': home_yellows,
-                'away_yellows': away_yellows
-            })
-    
-    matches.sort(key=lambda x: int(re.search(r'\d+', x['round']).group()))
+    matches.sort_by_round()
     print(f"Total pertandingan selesai: {len(matches)}")
     return matches
 
-def compute_standings_per_round(matches):
-    teams = set(m['home'] for m in matches) | set(m['away'] for m in matches)
-    
-    # Stats tim dengan fair play (kartu kuning dan merah)
-    stats = {team: {
-        'P': 0, 'W': 0, 'D': 0, 'L': 0, 
-        'GF': 0, 'GA': 0, 'Pts': 0, 
-        'Reds': 0, 'Yellows': 0
-    } for team in teams}
-    
-    # H2H data: h2h[teamA][teamB] = {'pts': 0, 'gf': 0, 'ga': 0, 'matches': 0}
-    h2h = defaultdict(lambda: defaultdict(lambda: {'pts': 0, 'gf': 0, 'ga': 0, 'matches': 0}))
+def compute_standings_per_round(matches, previous=None, from_round=None):
+    """
+    Klasemen setelah setiap pekan. `matches` berupa MatchStore (atau list
+    record, diubah ke MatchStore) yang sudah terurut per pekan. Dengan
+    `previous` dan `from_round`, pekan sebelum `from_round` diambil dari
+    `previous` (tidak dihitung ulang); pertandingannya tetap diterapkan
+    ke mesin agar state benar.
+    """
+    store = matches if isinstance(matches, MatchStore) else MatchStore.from_matches(matches)
+    engine = IncrementalStandings(store.teams)
+    round_names = store.round_names
     
     standings_per_round = {}
     current_round = None
     
-    for match in matches:
-        if match['round'] != current_round:
-            if current_round:
-                standings_per_round[current_round] = build_standings_with_liga1_rules(stats, teams, h2h)
-            current_round = match['round']
+    def close_round(round_id):
+        name = round_names[round_id]
+        if from_round is not None and round_number(name) < from_round and name in previous:
+            standings_per_round[name] = previous[name]
+        else:
+            standings_per_round[name] = engine.table()
+    
+    apply_result = engine.apply_result
+    for round_id, *result in store.rows():
+        if round_id != current_round:
+            if current_round is not None:
+                close_round(current_round)
+            current_round = round_id
+        apply_result(*result)
+    
+    if current_round is not None:
+        close_round(current_round)
+    
+    return standings_per_round
+
+# Jumlah pekan terakhir yang selalu diambil ulang di mode inkremental
+# (pekan yang belum lengkap, hasil yang dikoreksi, laga tunda)
+INCREMENTAL_OVERLAP_ROUNDS = 1
+
+def match_key(match):
+    return (match['round'], match['home'], match['away'])
+
+def merge_matches(existing, fetched):
+    """
+    Gabungkan hasil lama dengan hasil yang baru diambil (kunci: pekan,
+    tuan rumah, tamu). Mengembalikan (daftar gabungan terurut per pekan,
+    nomor pekan pertama yang berubah atau None jika tidak ada perubahan).
+    """
+    merged = {match_key(m): m for m in existing}
+    first_changed = None
+    for match in fetched:
+        key = match_key(match)
+        if merged.get(key) != match:
+            merged[key] = match
+            number = round_number(match['round'])
+            if first_changed is None or number < first_changed:
+                first_changed = number
+    
+    matches = sorted(merged.values(), key=lambda x: round_number(x['round']))
+    return matches, first_changed
+
+# Format ringkas: statistik setiap pekan diturunkan dari hasil pertandingan
+# (delta antar pekan = pertandingan di pekan itu), jadi yang disimpan hanya
+# kolom hasil + urutan tim per pekan (keluaran tie-break).
+COMPACT_FORMAT = "perweek-compact/1"
+
+def compact_output_path(path):
+    root, ext = os.path.splitext(path)
+    return f"{root}.compact{ext or '.json'}"
+
+def encode_compact(output):
+    """Ubah output penuh (dict perweek.json) ke format ringkas berbasis kolom."""
+    store = MatchStore.from_matches(output["matches"])
+    team_ids = store.team_ids
+    rounds = list(output["standings"])
+    round_ids = {name: i for i, name in enumerate(rounds)}
+    
+    columns = {name: list(store.columns[name]) for name, _ in MATCH_COLUMNS}
+    # Id pekan mengikuti urutan "rounds" (urutan klasemen), bukan urutan intern store
+    columns['round'] = [round_ids[store.round_names[r]] for r in columns['round']]
+    
+    compact = {key: value for key, value in output.items() if key not in ("standings", "matches")}
+    compact.update({
+        "format": COMPACT_FORMAT,
+        "teams": store.teams,
+        "rounds": rounds,
+        "matches": columns,
+        "order": [[team_ids[row['team']] for row in output["standings"][name]] for name in rounds],
+    })
+    return compact
+
+def expand_compact(compact):
+    """Kebalikan encode_compact: bangun ulang struktur perweek.json penuh."""
+    teams = compact["teams"]
+    rounds = compact["rounds"]
+    columns = compact["matches"]
+    names = [name for name, _ in MATCH_COLUMNS]
+    records = list(zip(*(columns[name] for name in names)))
+    
+    # Kumulatif statistik per tim; tabel pekan r = semua hasil sampai pekan r
+    stats = [dict.fromkeys(STAT_FIELDS, 0) for _ in teams]
+    by_round = defaultdict(list)
+    for record in records:
+        by_round[record[0]].append(record)
+    
+    standings = {}
+    for round_id, name in enumerate(rounds):
+        for _, h, a, hs, asa, hr, ar, hy, ay in by_round[round_id]:
+            for team, gf, ga, reds, yellows in ((h, hs, asa, hr, hy), (a, asa, hs, ar, ay)):
+                s = stats[team]
+                s['P'] += 1
+                s['GF'] += gf
+                s['GA'] += ga
+                s['Reds'] += reds
+                s['Yellows'] += yellows
+                if gf > ga:
+                    s['W'] += 1
+                    s['Pts'] += 3
+                elif gf < ga:
+                    s['L'] += 1
+                else:
+                    s['D'] += 1
+                    s['Pts'] += 1
+        table = []
+        for rank, team in enumerate(compact["order"][round_id], 1):
+            row = build_standings_row(teams[team], stats[team])
+            row['rank'] = rank
+            table.append(row)
+        standings[name] = table
+    
+    matches = [{
+        'round': rounds[r],
+        'home': teams[h],
+        'away': teams[a],
+        'home_score': hs,
+        'away_score': asa,
+        'home_reds': hr,
+        'away_reds': ar,
+        'home_yellows': hy,
+        'away_yellows': ay
+    } for r, h, a, hs, asa, hr, ar, hy, ay in records]
+    
+    output = {key: value for key, value in compact.items()
+              if key not in ("format", "teams", "rounds", "matches", "order")}
+    output["standings"] = standings
+    output["matches"] = matches
+    return output
+
+def load_perweek(path):
+    """Baca perweek.json, format penuh atau ringkas; selalu mengembalikan format penuh."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") == COMPACT_FORMAT:
+        return expand_compact(data)
+    return data
+
+def load_previous_output(path):
+    try:
+        previous = load_perweek(path)
+    except (OSError, ValueError):
+        return None
+    if not previous.get("matches") or not previous.get("standings"):
+        return None
+    return previous
+
+def stored_rounds_problem(matches, before_round):
+    """
+    Cek kelengkapan hasil tersimpan sebelum mode inkremental: pekan 1 sampai
+    `before_round` - 1 harus berurutan tanpa celah dan masing-masing berisi
+    jumlah tim // 2 pertandingan. Muat sebelumnya yang terpotong (tombol "show
+    more" berhenti terlalu awal) kehilangan pekan-pekan terlama, dan mode
+    inkremental tidak pernah mengambilnya lagi. Mengembalikan deskripsi
+    masalah, atau None jika lengkap. Laga tunda yang belum dimainkan juga
+    terhitung tidak lengkap (aman: jatuh ke muat penuh).
+    """
+    teams = {m['home'] for m in matches} | {m['away'] for m in matches}
+    expected = len(teams) // 2
+    per_round = defaultdict(int)
+    for m in matches:
+        per_round[round_number(m['round'])] += 1
+    
+    missing = [r for r in range(1, before_round) if r not in per_round]
+    if missing:
+        return f"pekan {', '.join(map(str, missing))} tidak ada"
+    short = [r for r in range(1, before_round) if per_round[r] < expected]
+    if short:
+        return f"pekan {', '.join(map(str, short))} kurang dari {expected} pertandingan"
+    return None
+
+class IncrementalStandings:
+    """
+    Mesin klasemen inkremental per pekan, berjalan di atas id integer tim.
+    
+    Urutan pekan sebelumnya dibawa ke pekan berikutnya: hanya tim yang
+    bertanding (statistiknya berubah) dan grup poin yang mereka sentuh
+    yang diurutkan ulang dengan aturan Liga 1. Grup poin yang anggotanya
+    sama dan tidak ada yang bertanding memakai urutan lama. Row yang
+    tidak berubah (statistik dan peringkat sama) dipakai bersama antar
+    pekan, bukan disalin. Hasilnya identik dengan
+    build_standings_with_liga1_rules pada setiap pekan.
+    """
+    
+    def __init__(self, teams):
+        # Urutan kanonik tim = urutan iterasi `teams`, sama seperti rebuild penuh;
+        # id tim = posisinya dalam urutan ini
+        self.team_order = list(teams)
+        self.index = {team: i for i, team in enumerate(self.team_order)}
+        n = len(self.team_order)
         
-        h = match['home']
-        a = match['away']
-        hs = match['home_score']
-        asa = match['away_score']
+        # Stats tim (baris = id tim, kolom = STAT_FIELDS) termasuk kartu untuk fair play
+        self.stats = [[0] * len(STAT_FIELDS) for _ in range(n)]
         
-        # Update overall stats
-        stats[h]['GF'] += hs
-        stats[h]['GA'] += asa
-        stats[a]['GF'] += asa
-        stats[a]['GA'] += hs
-        stats[h]['Reds'] += match['home_reds']
-        stats[a]['Reds'] += match['away_reds']
-        stats[h]['Yellows'] += match['home_yellows']
-        stats[a]['Yellows'] += match['away_yellows']
+        # H2H data: (id tim, id lawan) -> (poin, GF, GA, jumlah pertemuan)
+        self.h2h = H2HRecords(self.team_order)
         
-        stats[h]['P'] += 1
-        stats[a]['P'] += 1
+        self.rows = {}      # id tim -> row terbaru (dibangun ulang hanya jika berubah)
+        self.ranked = {}    # id tim -> row final (dengan rank) dari tabel terakhir
+        self.groups = {}    # poin -> (anggota grup, urutan hasil tie-break)
+        self.dirty = set(range(n))
+    
+    def fork(self):
+        """Salinan state untuk simulasi what-if tanpa mengubah mesin asli."""
+        clone = copy.copy(self)
+        clone.stats = [list(s) for s in self.stats]
+        clone.h2h = self.h2h.copy()
+        clone.rows = dict(self.rows)
+        clone.ranked = dict(self.ranked)
+        clone.groups = dict(self.groups)
+        clone.dirty = set(self.dirty)
+        return clone
+    
+    def apply_match(self, match):
+        index = self.index
+        self.apply_result(
+            index[match['home']], index[match['away']],
+            match['home_score'], match['away_score'],
+            match['home_reds'], match['away_reds'],
+            match['home_yellows'], match['away_yellows']
+        )
+    
+    def apply_result(self, h, a, hs, asa, home_reds, away_reds, home_yellows, away_yellows):
+        """Terapkan satu hasil; h dan a adalah id tim."""
+        home = self.stats[h]
+        away = self.stats[a]
+        
+        # Update overall stats: P, GF, GA, kartu
+        home[STAT_P] += 1
+        away[STAT_P] += 1
+        home[STAT_GF] += hs
+        home[STAT_GA] += asa
+        away[STAT_GF] += asa
+        away[STAT_GA] += hs
+        home[STAT_REDS] += home_reds
+        away[STAT_REDS] += away_reds
+        home[STAT_YELLOWS] += home_yellows
+        away[STAT_YELLOWS] += away_yellows
         
         if hs > asa:
-            stats[h]['W'] += 1
-            stats[h]['Pts'] += 3
-            stats[a]['L'] += 1
+            home[STAT_W] += 1
+            home[STAT_PTS] += 3
+            away[STAT_L] += 1
         elif hs < asa:
-            stats[a]['W'] += 1
-            stats[a]['Pts'] += 3
-            stats[h]['L'] += 1
+            away[STAT_W] += 1
+            away[STAT_PTS] += 3
+            home[STAT_L] += 1
         else:
-            stats[h]['D'] += 1
-            stats[a]['D'] += 1
-            stats[h]['Pts'] += 1
-            stats[a]['Pts'] += 1
+            home[STAT_D] += 1
+            away[STAT_D] += 1
+            home[STAT_PTS] += 1
+            away[STAT_PTS] += 1
         
         # Update H2H records
-        h2h[h][a]['gf'] += hs
-        h2h[h][a]['ga'] += asa
-        h2h[h][a]['matches'] += 1
-        h2h[a][h]['gf'] += asa
-        h2h[a][h]['ga'] += hs
-        h2h[a][h]['matches'] += 1
+        self.h2h.apply_ids(h, a, hs, asa)
         
-        if hs > asa:
-            h2h[h][a]['pts'] += 3
-        elif hs < asa:
-            h2h[a][h]['pts'] += 3
-        else:
-            h2h[h][a]['pts'] += 1
-            h2h[a][h]['pts'] += 1
-    
-    if current_round:
-        standings_per_round[current_round] = build_standings_with_liga1_rules(stats, teams, h2h)
+        self.dirty.add(h)
+        self.dirty.add(a)
     
-    return standings_per_round
+    def table(self):
+        """Klasemen saat ini (list row berperingkat), sesuai regulasi Liga 1."""
+        dirty = self.dirty
+        rows = self.rows
+        team_order = self.team_order
+        for i in dirty:
+            rows[i] = build_standings_row(team_order[i], dict(zip(STAT_FIELDS, self.stats[i])))
+        
+        by_points = defaultdict(list)
+        for i in range(len(team_order)):
+            by_points[rows[i]['points']].append(i)
+        
+        groups = {}
+        ordered = []
+        for points in sorted(by_points, reverse=True):
+            members = by_points[points]
+            if len(members) == 1:
+                order = members
+            else:
+                key = frozenset(members)
+                previous = self.groups.get(points)
+                if previous is not None and previous[0] == key and not (key & dirty):
+                    order = previous[1]
+                else:
+                    group = sorted((rows[i] for i in members), key=overall_sort_key)
+                    order = [self.index[row['team']] for row in resolve_points_group(group, self.h2h)]
+                groups[points] = (key, order)
+            ordered.extend(order)
+        
+        table = []
+        ranked = {}
+        for rank, i in enumerate(ordered, 1):
+            if i in dirty:
+                # Row baru pekan ini, belum dipakai tabel lain: cukup beri rank
+                row = rows[i]
+                row['rank'] = rank
+            else:
+                row = self.ranked[i]
+                if row['rank'] != rank:
+                    row = {**row, 'rank': rank}
+            ranked[i] = row
+            table.append(row)
+        
+        self.groups = groups
+        self.ranked = ranked
+        self.dirty = set()
+        return table
+
+# Kolom statistik tim di IncrementalStandings.stats (nama = key dict stats)
+STAT_FIELDS = ('P', 'W', 'D', 'L', 'GF', 'GA', 'Pts', 'Reds', 'Yellows')
+STAT_P, STAT_W, STAT_D, STAT_L, STAT_GF, STAT_GA, STAT_PTS, STAT_REDS, STAT_YELLOWS = range(len(STAT_FIELDS))
 
 def calculate_fair_play_points(yellows, reds):
     """
@@ -214,6 +784,71 @@ def calculate_fair_play_points(yellows, reds):
     """
     return yellows * 1 + reds * 3
 
+# Posisi field pada record H2H
+H2H_PTS, H2H_GF, H2H_GA, H2H_MATCHES = range(4)
+
+class H2HRecords:
+    """
+    Record head-to-head: (id tim, id lawan) -> tuple (poin, GF, GA, jumlah
+    pertemuan). Grup tie di Liga 1 kecil, jadi loop Python atas beberapa
+    pasangan lebih cepat daripada indexing matriks NumPy per pemanggilan.
+    Tuple tidak diubah in-place, jadi copy() cukup menyalin dict-nya.
+    """
+    
+    EMPTY = (0, 0, 0, 0)
+    
+    def __init__(self, teams):
+        self.index = {team: i for i, team in enumerate(teams)}
+        self.records = {}
+    
+    def copy(self):
+        clone = H2HRecords([])
+        clone.index = self.index
+        clone.records = dict(self.records)
+        return clone
+    
+    def apply_ids(self, h, a, home_score, away_score):
+        records = self.records
+        empty = self.EMPTY
+        if home_score > away_score:
+            home_pts, away_pts = 3, 0
+        elif home_score < away_score:
+            home_pts, away_pts = 0, 3
+        else:
+            home_pts, away_pts = 1, 1
+        pts, gf, ga, matches = records.get((h, a), empty)
+        records[(h, a)] = (pts + home_pts, gf + home_score, ga + away_score, matches + 1)
+        pts, gf, ga, matches = records.get((a, h), empty)
+        records[(a, h)] = (pts + away_pts, gf + away_score, ga + home_score, matches + 1)
+    
+    def meetings_equal(self, teams):
+        """True jika setiap pasangan dalam grup sudah bertemu dengan jumlah yang sama (> 0)."""
+        ids = [self.index[team] for team in teams]
+        records = self.records
+        empty = self.EMPTY
+        meeting_counts = set()
+        for pos, i in enumerate(ids):
+            for j in ids[pos + 1:]:
+                meeting_counts.add(records.get((i, j), empty)[H2H_MATCHES])
+        return len(meeting_counts) == 1 and 0 not in meeting_counts
+    
+    def group_stats(self, teams):
+        """(H2H pts, H2H GD, H2H GF) tiap tim melawan tim lain dalam grup."""
+        ids = [self.index[team] for team in teams]
+        records = self.records
+        empty = self.EMPTY
+        result = []
+        for i in ids:
+            h2h_pts = h2h_gf = h2h_ga = 0
+            for j in ids:
+                if i != j:
+                    pts, gf, ga, _ = records.get((i, j), empty)
+                    h2h_pts += pts
+                    h2h_gf += gf
+                    h2h_ga += ga
+            result.append((h2h_pts, h2h_gf - h2h_ga, h2h_gf))
+        return result
+
 def check_h2h_eligibility(group, h2h):
     """
     Cek apakah semua tim dalam grup memiliki:
@@ -223,114 +858,74 @@ def check_h2h_eligibility(group, h2h):
     if len(group) < 2:
         return False
     
-    # Cek apakah semua tim sudah bertemu dengan jumlah yang sama
-    team_names = [row['team'] for row in group]
-    meeting_counts = set()
-    
-    for i, team in enumerate(team_names):
-        for opponent in team_names[i+1:]:
-            meetings = h2h[team][opponent]['matches']
-            meeting_counts.add(meetings)
-    
     # Semua pertemuan harus memiliki jumlah yang sama dan > 0
-    if len(meeting_counts) != 1 or 0 in meeting_counts:
-        return False
-    
-    return True
-
-def calculate_h2h_stats(team, opponents, h2h):
-    """Hitung statistik H2H tim terhadap grup lawan"""
-    h2h_pts = 0
-    h2h_gf = 0
-    h2h_ga = 0
-    
-    for opponent in opponents:
-        record = h2h[team].get(opponent, {'pts': 0, 'gf': 0, 'ga': 0})
-        h2h_pts += record['pts']
-        h2h_gf += record['gf']
-        h2h_ga += record['ga']
-    
-    h2h_gd = h2h_gf - h2h_ga
-    return h2h_pts, h2h_gd, h2h_gf
+    return h2h.meetings_equal([row['team'] for row in group])
 
-def sort_group_by_h2h(group, h2h):
+def sort_group_by_h2h(group, h2h_stats):
     """
     Urutkan grup berdasarkan kriteria H2H Liga 1:
     a) H2H points
     b) H2H goal difference  
     c) H2H goals scored
+    `h2h_stats` sejajar dengan `group` (hasil H2HRecords.group_stats).
     """
-    team_names = [row['team'] for row in group]
-    
-    def h2h_key(row):
-        team = row['team']
-        opponents = [t for t in team_names if t != team]
-        h2h_pts, h2h_gd, h2h_gf = calculate_h2h_stats(team, opponents, h2h)
-        return (h2h_pts, h2h_gd, h2h_gf)
-    
-    group.sort(key=h2h_key, reverse=True)
-    return group
+    keyed = sorted(zip(h2h_stats, group), key=lambda pair: pair[0], reverse=True)
+    return [row for _, row in keyed]
 
-def h2h_resolves_tie(group, h2h):
+def h2h_resolves_tie(h2h_stats):
     """
     Cek apakah H2H bisa memisahkan peringkat.
     Return True jika semua tim memiliki H2H stats yang berbeda.
     """
-    team_names = [row['team'] for row in group]
-    h2h_stats = []
-    
-    for row in group:
-        team = row['team']
-        opponents = [t for t in team_names if t != team]
-        stats = calculate_h2h_stats(team, opponents, h2h)
-        h2h_stats.append(stats)
-    
     # Cek apakah ada duplikat
     return len(h2h_stats) == len(set(h2h_stats))
 
-def try_tiebreaker_subgroups(group, h2h):
-    """
-    Jika H2H utama tidak berhasil, coba tie-breaker untuk subgrup.
-    Mencoba memecah grup yang masih tied berdasarkan H2H di antara mereka.
-    """
-    team_names = [row['team'] for row in group]
-    
-    # Hitung H2H stats untuk setiap tim
-    h2h_data = {}
-    for row in group:
-        team = row['team']
-        opponents = [t for t in team_names if t != team]
-        h2h_data[team] = calculate_h2h_stats(team, opponents, h2h)
-    
-    # Kelompokkan tim dengan H2H stats yang sama
-    stats_to_teams = defaultdict(list)
-    for team, stats in h2h_data.items():
-        stats_to_teams[stats].append(team)
-    
-    result = []
-    # Urutkan berdasarkan H2H stats (descending)
-    for stats in sorted(stats_to_teams.keys(), reverse=True):
-        teams_with_same_stats = stats_to_teams[stats]
-        if len(teams_with_same_stats) == 1:
-            # Sudah terpecah
-            team = teams_with_same_stats[0]
-            result.append(next(row for row in group if row['team'] == team))
-        else:
-            # Masih tied, coba tie-breaker rekursif untuk subgrup ini
-            subgroup = [row for row in group if row['team'] in teams_with_same_stats]
-            if len(subgroup) > 1:
-                # Hitung H2H hanya di antara tim yang masih tied
-                subgroup_names = [row['team'] for row in subgroup]
-                
-                def subgroup_h2h_key(row):
-                    team = row['team']
-                    sub_opponents = [t for t in subgroup_names if t != team]
-                    return calculate_h2h_stats(team, sub_opponents, h2h)
-                
-                subgroup.sort(key=subgroup_h2h_key, reverse=True)
-            result.extend(subgroup)
-    
-    return result
+def build_standings_row(team, s):
+    gd = s['GF'] - s['GA']
+    fair_play = calculate_fair_play_points(s['Yellows'], s['Reds'])
+    return {
+        'team': team,
+        'played': s['P'],
+        'win': s['W'],
+        'draw': s['D'],
+        'loss': s['L'],
+        'gf': s['GF'],
+        'ga': s['GA'],
+        'gd': gd,
+        'points': s['Pts'],
+        'yellows': s['Yellows'],
+        'reds': s['Reds'],
+        'fair_play': fair_play
+    }
+
+def overall_sort_key(row):
+    # Descending points, lalu overall criteria sebagai fallback awal
+    return (-row['points'], -row['gd'], -row['gf'], row['fair_play'])
+
+def resolve_points_group(group, h2h):
+    """
+    Urutkan satu grup tim dengan poin sama (sudah terurut overall_sort_key)
+    sesuai kriteria Liga 1. Mengembalikan list row baru yang terurut.
+    """
+    if len(group) < 2:
+        return list(group)
+    
+    # Cek apakah H2H eligible
+    if check_h2h_eligibility(group, h2h):
+        # H2H stats grup dihitung sekali, dipakai untuk cek dan pengurutan
+        h2h_stats = h2h.group_stats([row['team'] for row in group])
+        
+        if h2h_resolves_tie(h2h_stats):
+            # H2H berhasil memisahkan semua tim
+            return sort_group_by_h2h(group, h2h_stats)
+        
+        # H2H gagal memisahkan semua tim, kembali ke overall criteria
+        # ii. Overall GD, iii. Overall GF, iv. Fair play
+        return sorted(group, key=lambda x: (-x['gd'], -x['gf'], x['fair_play']))
+    
+    # H2H tidak eligible (pertandingan/pertemuan tidak lengkap)
+    # Langsung ke overall criteria
+    return sorted(group, key=lambda x: (-x['gd'], -x['gf'], x['fair_play']))
 
 def build_standings_with_liga1_rules(stats, teams, h2h):
     """
@@ -346,29 +941,13 @@ def build_standings_with_liga1_rules(stats, teams, h2h):
        a) Overall goal difference
        b) Overall goals scored
        c) Fair play (lebih sedikit = lebih baik)
+    
+    Rebuild penuh; untuk klasemen per pekan lihat IncrementalStandings.
     """
-    table = []
-    for team in teams:
-        s = stats[team]
-        gd = s['GF'] - s['GA']
-        fair_play = calculate_fair_play_points(s['Yellows'], s['Reds'])
-        table.append({
-            'team': team,
-            'played': s['P'],
-            'win': s['W'],
-            'draw': s['D'],
-            'loss': s['L'],
-            'gf': s['GF'],
-            'ga': s['GA'],
-            'gd': gd,
-            'points': s['Pts'],
-            'yellows': s['Yellows'],
-            'reds': s['Reds'],
-            'fair_play': fair_play
-        })
+    table = [build_standings_row(team, stats[team]) for team in teams]
     
     # Sort awal: descending points, lalu overall criteria sebagai fallback awal
-    table.sort(key=lambda x: (-x['points'], -x['gd'], -x['gf'], x['fair_play']))
+    table.sort(key=overall_sort_key)
     
     # Proses grup yang memiliki poin sama
     i = 0
@@ -380,34 +959,7 @@ def build_standings_with_liga1_rules(stats, teams, h2h):
         while i < len(table) and table[i]['points'] == current_points:
             i += 1
         
-        group = table[start:i]
-        
-        if len(group) > 1:
-            # Cek apakah H2H eligible
-            if check_h2h_eligibility(group, h2h):
-                # Coba H2H
-                sorted_group = sort_group_by_h2h(group.copy(), h2h)
-                
-                if h2h_resolves_tie(sorted_group, h2h):
-                    # H2H berhasil memisahkan semua tim
-                    table[start:i] = sorted_group
-                else:
-                    # H2H tidak memisahkan semua, coba tie-breaker subgrup
-                    sorted_group = try_tiebreaker_subgroups(sorted_group, h2h)
-                    
-                    # Cek lagi apakah tie-breaker berhasil
-                    if h2h_resolves_tie(sorted_group, h2h):
-                        table[start:i] = sorted_group
-                    else:
-                        # H2H dan tie-breaker gagal, kembali ke overall criteria
-                        # ii. Overall GD, iii. Overall GF, iv. Fair play
-                        group.sort(key=lambda x: (-x['gd'], -x['gf'], x['fair_play']))
-                        table[start:i] = group
-            else:
-                # H2H tidak eligible (pertandingan/pertemuan tidak lengkap)
-                # Langsung ke overall criteria
-                group.sort(key=lambda x: (-x['gd'], -x['gf'], x['fair_play']))
-                table[start:i] = group
+        table[start:i] = resolve_points_group(table[start:i], h2h)
     
     # Assign rank
     for rank, row in enumerate(table, 1):
@@ -416,33 +968,184 @@ def build_standings_with_liga1_rules(stats, teams, h2h):
     return table
 
 # === MAIN ===
-url = "https://www.flashscore.com/football/indonesia/super-league/results/"
-
-html = fetch_full_html(url)
-matches = extract_matches(html)
-standings_per_round = compute_standings_per_round(matches)
-
-output = {
-    "league": "BRI Liga 1 Indonesia",
-    "season": "2025/2026",
-    "generated_at": datetime.now().isoformat(),
-    "note": "Tie-breaker sesuai regulasi PT LIB: 1. Points, 2a. H2H Points, 2b. H2H GD, 2c. H2H GF (jika eligible), 3. Overall GD, 4. Overall GF, 5. Fair Play (kuning×1 + merah×3)",
-    "total_matches": len(matches),
-    "standings": standings_per_round
-}
-
-with open("perweek.json", "w", encoding="utf-8") as f:
-    json.dump(output, f, ensure_ascii=False, indent=2)
-
-print("\nFile perweek.json berhasil diperbarui!")
-print(f"Total pekan: {len(standings_per_round)}")
-print("Regulasi tie-breaker Liga 1 telah diterapkan:")
-print("  1. Poin")
-print("  2. Head-to-head (jika eligible):")
-print("     a) H2H points")
-print("     b) H2H goal difference")
-print("     c) H2H goals scored")
-print("  3. Jika H2H gagal/tidak eligible:")
-print("     - Overall goal difference")
-print("     - Overall goals scored")
-print("     - Fair play (kartu kuning × 1 + kartu merah × 3)")
\ No newline at end of file
+# Liga default (tanpa --url / --leagues). `output` relatif terhadap direktori kerja.
+LEAGUES = [
+    {
+        "name": "BRI Liga 1 Indonesia",
+        "season": "2025/2026",
+        "url": "https://www.flashscore.com/football/indonesia/super-league/results/",
+        "output": "perweek.json",
+    },
+]
+
+# Jumlah Chrome driver yang berjalan bersamaan di mode batch
+BROWSER_POOL_SIZE = 2
+
+TIE_BREAK_NOTE = "Tie-breaker sesuai regulasi PT LIB: 1. Points, 2a. H2H Points, 2b. H2H GD, 2c. H2H GF (jika eligible), 3. Overall GD, 4. Overall GF, 5. Fair Play (kuning×1 + merah×3)"
+
+def league_from_url(url):
+    """Spesifikasi liga dari URL hasil Flashscore (/football/<negara>/<liga>/results/)."""
+    parts = [part for part in urlparse(url).path.split('/') if part]
+    if len(parts) < 3:
+        raise ValueError(f"URL Flashscore tidak dikenali: {url}")
+    country, league = parts[1], parts[2]
+    return {
+        "name": f"{country}/{league}",
+        "season": None,
+        "url": url,
+        "output": f"perweek_{country}_{league}.json".replace('-', '_'),
+    }
+
+def load_leagues(args):
+    if args.leagues:
+        with open(args.leagues, encoding="utf-8") as f:
+            leagues = json.load(f)
+        return [{**league_from_url(league["url"]), **league} for league in leagues]
+    if args.url:
+        return [league_from_url(url) for url in args.url]
+    return LEAGUES
+
+def scrape_league(league, full, pool):
+    """
+    Ambil hasil satu liga (penuh atau inkremental). Mengembalikan job
+    untuk compute_league, atau None jika tidak ada hasil baru.
+    """
+    output = league["output"]
+    previous = None if full else load_previous_output(output)
+    
+    if previous is None:
+        if not full:
+            print(f"{output} belum ada atau tanpa data 'matches', memuat seluruh musim.")
+        with pool.driver() as driver:
+            html = fetch_full_html(league["url"], driver=driver)
+        return {"league": league, "matches": extract_matches(html), "previous": None, "from_round": None}
+    
+    # Mode inkremental: ambil pekan terakhir (+ overlap) saja
+    last_round = max(round_number(m['round']) for m in previous['matches'])
+    refetch_from = max(1, last_round - INCREMENTAL_OVERLAP_ROUNDS)
+    problem = stored_rounds_problem(previous['matches'], refetch_from)
+    if problem is not None:
+        print(f"[{league['name']}] Hasil tersimpan tidak lengkap ({problem}), memuat seluruh musim.")
+        return scrape_league(league, True, pool)
+    print(f"[{league['name']}] Mode inkremental: pekan terakhir tersimpan {last_round}, mengambil ulang dari pekan {refetch_from}")
+    
+    with pool.driver() as driver:
+        html = fetch_full_html(league["url"], stop_before_round=refetch_from, driver=driver)
+    fetched = extract_matches(html).to_dicts()
+    merged, first_changed = merge_matches(previous['matches'], fetched)
+    
+    if first_changed is None:
+        print(f"[{league['name']}] Tidak ada hasil baru, {output} tidak diubah.")
+        return None
+    
+    print(f"[{league['name']}] Menghitung ulang klasemen mulai pekan {first_changed}")
+    return {
+        "league": league,
+        "matches": MatchStore.from_matches(merged),
+        "previous": previous['standings'],
+        "from_round": first_changed,
+    }
+
+def compute_league(job):
+    """Dijalankan di process pool: klasemen per pekan untuk satu job."""
+    return compute_standings_per_round(job["matches"], previous=job["previous"], from_round=job["from_round"])
+
+def write_league_output(league, matches, standings_per_round, output_format="full"):
+    """
+    output_format: "full" (perweek.json seperti biasa), "compact" (format
+    ringkas menggantikan file output), atau "both" (ringkas ditulis ke
+    <output>.compact.json di samping file penuh).
+    """
+    output = {
+        "league": league["name"],
+        "season": league["season"],
+        "generated_at": datetime.now().isoformat(),
+        "note": TIE_BREAK_NOTE,
+        "total_matches": len(matches),
+        "standings": standings_per_round,
+        # Hasil mentah, dipakai simulate_season.py
+        "matches": matches.to_dicts()
+    }
+    
+    path = league["output"]
+    if output_format in ("full", "both"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\nFile {path} berhasil diperbarui! Total pekan: {len(standings_per_round)}")
+    
+    if output_format in ("compact", "both"):
+        # Format ringkas ditulis tanpa spasi (minified)
+        compact_path = compact_output_path(path) if output_format == "both" else path
+        with open(compact_path, "w", encoding="utf-8") as f:
+            json.dump(encode_compact(output), f, ensure_ascii=False, separators=(',', ':'))
+        print(f"\nFile {compact_path} (format ringkas) berhasil diperbarui! Total pekan: {len(standings_per_round)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Klasemen per pekan dari Flashscore (aturan tie-break Liga 1)")
+    parser.add_argument("--full", action="store_true",
+                        help="Muat ulang seluruh musim dan hitung ulang semua pekan")
+    parser.add_argument("--url", action="append",
+                        help="URL hasil Flashscore; bisa diulang untuk beberapa liga/musim")
+    parser.add_argument("--leagues",
+                        help="File JSON berisi daftar liga: [{\"url\", \"name\", \"season\", \"output\"}]")
+    parser.add_argument("--format", choices=("full", "compact", "both"), default="full",
+                        help="Format output: penuh, ringkas (kolom + urutan per pekan, minified), atau keduanya")
+    parser.add_argument("--browsers", type=int, default=BROWSER_POOL_SIZE,
+                        help="Jumlah Chrome driver yang berjalan bersamaan")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Jumlah proses untuk menghitung klasemen")
+    args = parser.parse_args()
+    
+    leagues = load_leagues(args)
+    pool = DriverPool(max(1, min(args.browsers, len(leagues))))
+    failed = []
+    
+    # Satu liga: hitung di proses ini. Beberapa liga: process pool (spawn, karena
+    # proses induk sudah menjalankan thread scraping saat worker dibuat)
+    if len(leagues) == 1:
+        computers = ThreadPoolExecutor(max_workers=1)
+    else:
+        computers = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
+    
+    try:
+        # Scraping di thread (dibatasi pool driver); klasemen dihitung begitu hasil liga siap
+        with computers, ThreadPoolExecutor(max_workers=pool.size) as scrapers:
+            futures = {scrapers.submit(scrape_league, league, args.full, pool): league for league in leagues}
+            pending = []
+            for future in as_completed(futures):
+                league = futures[future]
+                try:
+                    job = future.result()
+                except Exception as e:
+                    print(f"[{league['name']}] Gagal memuat hasil: {e}")
+                    failed.append(league['name'])
+                    continue
+                if job is not None:
+                    pending.append((job, computers.submit(compute_league, job)))
+            
+            for job, result in pending:
+                league = job["league"]
+                try:
+                    write_league_output(league, job["matches"], result.result(), args.format)
+                except Exception as e:
+                    print(f"[{league['name']}] Gagal menghitung/menulis klasemen: {e}")
+                    failed.append(league['name'])
+    finally:
+        pool.close()
+    
+    print("Regulasi tie-breaker Liga 1 telah diterapkan:")
+    print("  1. Poin")
+    print("  2. Head-to-head (jika eligible):")
+    print("     a) H2H points")
+    print("     b) H2H goal difference")
+    print("     c) H2H goals scored")
+    print("  3. Jika H2H gagal/tidak eligible:")
+    print("     - Overall goal difference")
+    print("     - Overall goals scored")
+    print("     - Fair play (kartu kuning × 1 + kartu merah × 3)")
+    
+    if failed:
+        raise SystemExit(f"Gagal: {', '.join(failed)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Simulasi Monte Carlo sisa musim Liga 1.
+
+Membaca hasil pertandingan dari perweek.json, memainkan sisa jadwal
+(semua pasangan kandang/tandang yang belum dimainkan dalam format
+double round-robin) puluhan ribu kali, lalu menghitung peluang juara,
+zona AFC, dan degradasi setiap tim.
+
+- Skor disimulasikan dengan model Poisson (kekuatan serang/bertahan
+  dari hasil yang sudah dimainkan, plus keuntungan kandang).
+- Jalur batch tervektorisasi: semua run dalam satu chunk disimulasikan
+  sekaligus dalam array NumPy (run × pertandingan, run × tim).
+- Peringkat awal per run: poin, selisih gol, gol, fair play. Run yang
+  memiliki tim dengan poin sama di batas juara/AFC/degradasi diselesaikan
+  ulang dengan aturan lengkap PT LIB (build_standings_with_liga1_rules,
+  termasuk H2H).
+- Chunk dibagi ke beberapa core dengan ProcessPoolExecutor. Seed tiap
+  chunk diturunkan dari seed utama, jadi hasilnya tidak bergantung pada
+  jumlah worker.
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from perweek import H2HRecords, build_standings_with_liga1_rules, load_perweek
+
+CHUNK_SIZE = 2000
+
+# Bobot prior (dalam jumlah pertandingan) untuk menarik kekuatan tim ke rata-rata liga
+STRENGTH_PRIOR_MATCHES = 5
+
+
+def build_model(matches):
+    """Siapkan state awal (klasemen saat ini, H2H, sisa jadwal, rate gol) dari hasil."""
+    teams = sorted(set(m['home'] for m in matches) | set(m['away'] for m in matches))
+    index = {team: i for i, team in enumerate(teams)}
+    n = len(teams)
+
+    # Kolom statistik: P, W, D, L, GF, GA, Pts, Reds, Yellows
+    stats = np.zeros((n, 9), dtype=np.int64)
+    h2h = H2HRecords(teams)
+    played = set()
+    home_goals = away_goals = 0
+
+    for m in matches:
+        h, a = index[m['home']], index[m['away']]
+        hs, asa = m['home_score'], m['away_score']
+        played.add((h, a))
+        home_goals += hs
+        away_goals += asa
+        h2h.apply_ids(h, a, hs, asa)
+
+        for t, gf, ga, reds, yellows in ((h, hs, asa, m['home_reds'], m['home_yellows']),
+                                         (a, asa, hs, m['away_reds'], m['away_yellows'])):
+            stats[t, 0] += 1
+            stats[t, 4] += gf
+            stats[t, 5] += ga
+            stats[t, 7] += reds
+            stats[t, 8] += yellows
+            if gf > ga:
+                stats[t, 1] += 1
+                stats[t, 6] += 3
+            elif gf < ga:
+                stats[t, 3] += 1
+            else:
+                stats[t, 2] += 1
+                stats[t, 6] += 1
+
+    # Sisa jadwal: setiap pasangan bertemu sekali di kandang masing-masing
+    remaining = [(h, a) for h in range(n) for a in range(n) if h != a and (h, a) not in played]
+
+    # Kekuatan serang/bertahan relatif terhadap rata-rata liga
+    total_matches = max(len(matches), 1)
+    home_rate = home_goals / total_matches
+    away_rate = away_goals / total_matches
+    avg_goals = max((home_rate + away_rate) / 2, 0.1)
+    p = stats[:, 0]
+    k = STRENGTH_PRIOR_MATCHES
+    attack = (stats[:, 4] / avg_goals + k) / (p + k)
+    defence = (stats[:, 5] / avg_goals + k) / (p + k)
+
+    return {
+        'teams': teams,
+        'stats': stats,
+        'h2h': h2h,
+        'remaining': np.array(remaining, dtype=np.intp).reshape(-1, 2),
+        'home_rate': max(home_rate, 0.1),
+        'away_rate': max(away_rate, 0.1),
+        'attack': attack,
+        'defence': defence,
+    }
+
+
+def _cut_positions(n_teams, afc_spots, relegation_spots):
+    cuts = {1, afc_spots, n_teams - relegation_spots}
+    return sorted(c for c in cuts if 0 < c < n_teams)
+
+
+def _exact_order(model, home_goals, away_goals, sim_stats):
+    """Urutan tim satu run dengan aturan lengkap PT LIB (termasuk H2H)."""
+    teams = model['teams']
+    remaining = model['remaining']
+    h2h = model['h2h'].copy()
+    apply_ids = h2h.apply_ids
+    for h, a, hs, asa in zip(remaining[:, 0].tolist(), remaining[:, 1].tolist(),
+                             home_goals.tolist(), away_goals.tolist()):
+        apply_ids(h, a, hs, asa)
+
+    stats = {}
+    for i, team in enumerate(teams):
+        p, w, d, l, gf, ga, pts, reds, yellows = (int(v) for v in sim_stats[i])
+        stats[team] = {'P': p, 'W': w, 'D': d, 'L': l, 'GF': gf, 'GA': ga,
+                       'Pts': pts, 'Reds': reds, 'Yellows': yellows}
+
+    index = h2h.index
+    return [index[row['team']] for row in build_standings_with_liga1_rules(stats, teams, h2h)]
+
+
+def simulate_chunk(model, runs, seed, afc_spots, relegation_spots):
+    """
+    Simulasikan `runs` musim sekaligus (jalur batch tervektorisasi).
+    Mengembalikan matriks hitungan posisi akhir (tim × posisi) dan total poin.
+    """
+    rng = np.random.default_rng(seed)
+    teams = model['teams']
+    n = len(teams)
+    remaining = model['remaining']
+    base = model['stats']
+
+    position_counts = np.zeros((n, n), dtype=np.int64)
+    if len(remaining) == 0:
+        runs_stats = np.broadcast_to(base, (runs, n, base.shape[1]))
+        home_goals = away_goals = np.zeros((runs, 0), dtype=np.int64)
+    else:
+        h_idx, a_idx = remaining[:, 0], remaining[:, 1]
+        attack, defence = model['attack'], model['defence']
+        lam_home = model['home_rate'] * attack[h_idx] * defence[a_idx]
+        lam_away = model['away_rate'] * attack[a_idx] * defence[h_idx]
+
+        # Skor semua pertandingan di semua run: array (run, pertandingan)
+        home_goals = rng.poisson(lam_home, size=(runs, len(remaining)))
+        away_goals = rng.poisson(lam_away, size=(runs, len(remaining)))
+        home_win = home_goals > away_goals
+        away_win = home_goals < away_goals
+        draw = ~(home_win | away_win)
+
+        # Matriks insiden pertandingan -> tim untuk akumulasi per tim
+        home_inc = np.zeros((len(remaining), n), dtype=np.int64)
+        away_inc = np.zeros((len(remaining), n), dtype=np.int64)
+        home_inc[np.arange(len(remaining)), h_idx] = 1
+        away_inc[np.arange(len(remaining)), a_idx] = 1
+
+        add = np.zeros((runs, n, base.shape[1]), dtype=np.int64)
+        add[:, :, 0] = 1 * (home_inc.sum(axis=0) + away_inc.sum(axis=0))
+        add[:, :, 1] = home_win @ home_inc + away_win @ away_inc
+        add[:, :, 2] = draw @ home_inc + draw @ away_inc
+        add[:, :, 3] = away_win @ home_inc + home_win @ away_inc
+        add[:, :, 4] = home_goals @ home_inc + away_goals @ away_inc
+        add[:, :, 5] = away_goals @ home_inc + home_goals @ away_inc
+        add[:, :, 6] = 3 * add[:, :, 1] + add[:, :, 2]
+        runs_stats = base[None, :, :] + add
+
+    pts = runs_stats[:, :, 6]
+    gf = runs_stats[:, :, 4]
+    gd = gf - runs_stats[:, :, 5]
+    fair_play = runs_stats[:, :, 8] + 3 * runs_stats[:, :, 7]
+
+    # Peringkat cepat: poin, GD, GF, fair play (lebih kecil lebih baik)
+    key = ((pts * 1024 + (gd + 512)) * 1024 + gf) * 4096 + (4095 - fair_play)
+    order = np.argsort(-key, axis=1, kind='stable')
+
+    # Run dengan poin sama di batas juara/AFC/degradasi -> aturan lengkap (H2H)
+    sorted_pts = np.take_along_axis(pts, order, axis=1)
+    cuts = _cut_positions(n, afc_spots, relegation_spots)
+    tied = np.zeros(runs, dtype=bool)
+    for c in cuts:
+        tied |= sorted_pts[:, c - 1] == sorted_pts[:, c]
+    for r in np.flatnonzero(tied):
+        order[r] = _exact_order(model, home_goals[r], away_goals[r], runs_stats[r])
+
+    np.add.at(position_counts, (order, np.arange(n)[None, :]), 1)
+    return position_counts, pts.sum(axis=0), int(tied.sum())
+
+
+def simulate_season(model, runs, seed=0, workers=None, afc_spots=2, relegation_spots=3):
+    """Bagi `runs` ke chunk dan jalankan di process pool."""
+    chunks = [CHUNK_SIZE] * (runs // CHUNK_SIZE)
+    if runs % CHUNK_SIZE:
+        chunks.append(runs % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    n = len(model['teams'])
+    position_counts = np.zeros((n, n), dtype=np.int64)
+    total_points = np.zeros(n, dtype=np.int64)
+    exact_runs = 0
+
+    args = [(model, size, s, afc_spots, relegation_spots) for size, s in zip(chunks, seeds)]
+    if workers == 1 or len(chunks) == 1:
+        results = [simulate_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, *zip(*args)))
+
+    for counts, points, exact in results:
+        position_counts += counts
+        total_points += points
+        exact_runs += exact
+    return position_counts, total_points, exact_runs
+
+
+def summarize(model, runs, position_counts, total_points, afc_spots, relegation_spots):
+    n = len(model['teams'])
+    probs = position_counts / runs
+    positions = np.arange(1, n + 1)
+    table = []
+    for i, team in enumerate(model['teams']):
+        table.append({
+            'team': team,
+            'points': int(model['stats'][i, 6]),
+            'played': int(model['stats'][i, 0]),
+            'expected_points': round(float(total_points[i] / runs), 2),
+            'expected_rank': round(float((probs[i] * positions).sum()), 2),
+            'title': round(float(probs[i, 0]), 4),
+            'afc': round(float(probs[i, :afc_spots].sum()), 4),
+            'relegation': round(float(probs[i, n - relegation_spots:].sum()), 4),
+            'position_probabilities': [round(float(p), 4) for p in probs[i]],
+        })
+    table.sort(key=lambda row: (row['expected_rank'], row['team']))
+    return table
+
+
+def same_as_existing(path, output):
+    """True jika `path` sudah berisi hasil yang sama (generated_at diabaikan)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        return False
+    existing.pop("generated_at", None)
+    return existing == {key: value for key, value in output.items() if key != "generated_at"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi Monte Carlo sisa musim Liga 1")
+    parser.add_argument("--input", default="perweek.json")
+    parser.add_argument("--output", default="simulation.json")
+    parser.add_argument("--runs", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--afc-spots", type=int, default=2)
+    parser.add_argument("--relegation-spots", type=int, default=3)
+    args = parser.parse_args()
+
+    data = load_perweek(args.input)
+    matches = data.get("matches")
+    if not matches:
+        raise SystemExit(f"{args.input} tidak memuat daftar 'matches'; jalankan ulang perweek.py terlebih dahulu.")
+
+    model = build_model(matches)
+    print(f"Tim: {len(model['teams'])}, pertandingan dimainkan: {len(matches)}, sisa: {len(model['remaining'])}")
+
+    start = datetime.now()
+    position_counts, total_points, exact_runs = simulate_season(
+        model, args.runs, args.seed, args.workers, args.afc_spots, args.relegation_spots)
+    elapsed = (datetime.now() - start).total_seconds()
+    print(f"{args.runs} simulasi selesai dalam {elapsed:.2f} detik ({exact_runs} run diselesaikan dengan aturan H2H lengkap)")
+
+    output = {
+        "league": data.get("league"),
+        "season": data.get("season"),
+        "generated_at": datetime.now().isoformat(),
+        "simulations": args.runs,
+        "seed": args.seed,
+        "matches_played": len(matches),
+        "matches_remaining": len(model['remaining']),
+        "afc_spots": args.afc_spots,
+        "relegation_spots": args.relegation_spots,
+        "note": "Sisa jadwal = pasangan kandang/tandang yang belum dimainkan (double round-robin). Skor: model Poisson dari hasil musim ini. Fair play hanya dari kartu yang sudah terjadi.",
+        "teams": summarize(model, args.runs, position_counts, total_points, args.afc_spots, args.relegation_spots),
+    }
+
+    # Seed tetap: input yang sama menghasilkan hasil yang sama. File tidak
+    # ditulis ulang agar workflow tidak membuat commit hanya karena generated_at.
+    if same_as_existing(args.output, output):
+        print(f"Hasil simulasi tidak berubah, {args.output} tidak ditulis ulang")
+        return
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"File {args.output} berhasil diperbarui!")
+
+
+if __name__ == "__main__":
+    main()